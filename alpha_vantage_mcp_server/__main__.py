@@ -1,9 +1,18 @@
 import asyncio
 from .server import run_server
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 def main() -> None:
-    asyncio.run(run_server())
+    # uvloop is an optional, faster drop-in for the default event loop
+    if uvloop is not None:
+        uvloop.run(run_server())
+    else:
+        asyncio.run(run_server())
 
 
 if __name__ == "__main__":
@@ -1,8 +1,22 @@
+import asyncio
 import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
 
 import httpx
 from dotenv import load_dotenv
 
+from .json_utils import json_loads
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 load_dotenv()
 
 API_KEY = os.getenv("ALPHA_VANTAGE_KEY")
@@ -11,14 +25,203 @@ if not API_KEY:
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+# Keys of the bodies Alpha Vantage sends instead of data when a request is
+# throttled, needs a premium plan or is invalid (with HTTP status 200)
+NOTICE_KEYS = frozenset(("Note", "Information", "Error Message"))
+
+# Responses larger than this are parsed in a worker thread
+PARSE_IN_THREAD_THRESHOLD = 50_000
+
+# Upper bound on simultaneous requests to Alpha Vantage across all tools
+MAX_CONCURRENT_REQUESTS = int(os.getenv("API_MAX_CONCURRENT_REQUESTS", "5"))
+
+# Seconds an indicator pack waits for each indicator's request before leaving
+# it out (time spent queued behind other requests is not counted)
+INDICATOR_TIMEOUT = float(os.getenv("INDICATOR_TIMEOUT") or 20)
+
+# Requests per minute allowed by the Alpha Vantage plan (unset means no limit)
+API_RATE_LIMIT = float(os.getenv("API_RATE_LIMIT") or 0) or None
+
+
+class _RateLimiter:
+    """
+    Async limiter allowing ``rate_per_minute`` requests per minute.
+
+    Requests are spaced ``60 / rate_per_minute`` seconds apart rather than
+    allowed in bursts, so the limit holds over any window of a minute.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self._interval = 60 / rate_per_minute
+        # Earliest time the next request may be sent
+        self._next = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Callers queue on the lock, so requests are released in arrival order
+        async with self._lock:
+            delay = self._next - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next = max(self._next, time.monotonic()) + self._interval
+
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_request_slots: asyncio.Semaphore | None = None
+_rate_limiter: _RateLimiter | None = None
+# Upper bound in seconds on each request once sent, set by ``request_timeout``
+_request_timeout: ContextVar[float | None] = ContextVar(
+    "_request_timeout", default=None
+)
+
+
+def _discard_client(
+    client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a client left open by another event loop, if that loop still runs."""
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    # Otherwise the loop has finished and its connections, which cannot be
+    # closed from another loop, are released when the client is collected
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to Alpha Vantage alive between
+    requests (and multiplexed over HTTP/2 when ``h2`` is installed). A new
+    client is created if the event loop has changed, since connections cannot
+    be shared between loops.
+
+    The server runs on a single loop and closes the client with
+    ``aclose_client``; a loop change is only expected when ``asyncio.run`` is
+    called more than once (tests, scripts), and such callers should await
+    ``aclose_client`` before their loop ends.
+    """
+    global _client, _client_loop, _request_slots, _rate_limiter
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            _discard_client(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            http2=_HTTP2,
+            # Keep idle connections well past httpx's 5 second default
+            limits=httpx.Limits(
+                max_connections=50, max_keepalive_connections=20, keepalive_expiry=300
+            ),
+            timeout=30,
+        )
+        _client_loop = loop
+        _request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        if API_RATE_LIMIT:
+            _rate_limiter = _RateLimiter(API_RATE_LIMIT)
+    return _client
+
+
+async def warm_up_connections() -> None:
+    """
+    Open connections to Alpha Vantage before the first tool call needs them.
+
+    Sends bare HEAD requests (no API key, so no quota is used) to complete the
+    TCP and TLS handshakes. One connection is enough with HTTP/2; otherwise
+    one is opened per concurrent request slot.
+    """
+    client = _get_client()
+    count = 1 if _HTTP2 else MAX_CONCURRENT_REQUESTS
+    await asyncio.gather(
+        *(client.head(API_BASE_URL) for _ in range(count)), return_exceptions=True
+    )
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client, if one has been created."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+@contextmanager
+def request_timeout(seconds: float | None) -> Iterator[None]:
+    """
+    Fail requests started in this context that take longer than ``seconds``.
+
+    Only the request itself is timed, not the wait for a rate limit token or a
+    free request slot. Tasks created inside the context keep the timeout.
+    """
+    token = _request_timeout.set(seconds)
+    try:
+        yield
+    finally:
+        _request_timeout.reset(token)
+
+
+async def _get(https_params: dict[str, str]) -> httpx.Response:
+    """
+    Send a GET request to the Alpha Vantage API through the shared client.
+
+    At most ``MAX_CONCURRENT_REQUESTS`` requests are in flight at once, so
+    concurrent fan-outs (indicator packs, economic series, bulk quotes) do
+    not trip the upstream rate limit. When ``API_RATE_LIMIT`` is set, requests
+    are also spaced out to stay within that many per minute.
+    """
+    client = _get_client()
+    if _rate_limiter is not None:
+        await _rate_limiter.acquire()
+    async with _request_slots:
+        response = await asyncio.wait_for(
+            client.get(API_BASE_URL, params=https_params), _request_timeout.get()
+        )
+    response.raise_for_status()
+    return response
+
+
+def is_notice(data: Any) -> bool:
+    """Return whether ``data`` is an Alpha Vantage notice rather than data."""
+    return isinstance(data, dict) and bool(data) and data.keys() <= NOTICE_KEYS
+
+
+def _raise_for_notice(data: dict[str, str]) -> None:
+    """Raise if ``data`` is an Alpha Vantage notice rather than the requested data."""
+    if is_notice(data):
+        raise ValueError(
+            f"Alpha Vantage API error: {' '.join(map(str, data.values()))}"
+        )
+
+
+async def _parse_json(content: bytes) -> dict[str, str]:
+    """
+    Parse a JSON body, off the event loop thread if it is large.
+
+    Rate-limit notices and error messages are raised as ``ValueError`` so they
+    are never mistaken for (or cached as) data.
+    """
+    if len(content) > PARSE_IN_THREAD_THRESHOLD:
+        data = await asyncio.to_thread(json_loads, content)
+    else:
+        data = json_loads(content)
+    _raise_for_notice(data)
+    return data
+
+
+def _csv_text(response: httpx.Response) -> str:
+    """Return a CSV body, raising for the notices sent as JSON in its place."""
+    text = response.text
+    if text.lstrip().startswith("{"):
+        _raise_for_notice(json_loads(text))
+    return text
+
 
 async def _make_api_request(
     https_params: dict[str, str], datatype: str
 ) -> dict[str, str] | str:
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    response = await _get(https_params)
+    if datatype == "csv":
+        return _csv_text(response)
+    return await _parse_json(response.content)
 
 
 #####
@@ -561,10 +764,8 @@ async def fetch_cash_flow(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    response = await _get(https_params)
+    return await _parse_json(response.content)
 
 
 async def fetch_earnings(symbol: str) -> dict[str, str]:
@@ -826,7 +1027,7 @@ async def fetch_digital_currency_intraday(
     return await _make_api_request(https_params, datatype)
 
 
-async def fetch_digital_currency_daily(symbol: str, market: str) -> str:
+async def fetch_digital_currency_daily(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch daily digital currency data from the Alpha Vantage API.
 
@@ -843,10 +1044,10 @@ async def fetch_digital_currency_daily(symbol: str, market: str) -> str:
         "market": market,
         "apikey": API_KEY,
     }
-    return await _make_api_request(https_params, "csv")
+    return await _make_api_request(https_params, "json")
 
 
-async def fetch_digital_currency_weekly(symbol: str, market: str) -> str:
+async def fetch_digital_currency_weekly(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch weekly digital currency data from the Alpha Vantage API.
 
@@ -863,10 +1064,10 @@ async def fetch_digital_currency_weekly(symbol: str, market: str) -> str:
         "market": market,
         "apikey": API_KEY,
     }
-    return await _make_api_request(https_params, "csv")
+    return await _make_api_request(https_params, "json")
 
 
-async def fetch_digital_currency_monthly(symbol: str, market: str) -> str:
+async def fetch_digital_currency_monthly(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch monthly digital currency data from the Alpha Vantage API.
 
@@ -883,7 +1084,7 @@ async def fetch_digital_currency_monthly(symbol: str, market: str) -> str:
         "market": market,
         "apikey": API_KEY,
     }
-    return await _make_api_request(https_params, "csv")
+    return await _make_api_request(https_params, "json")
 
 
 #####
@@ -1376,29 +1577,26 @@ async def fetch_sma(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
+    response = await _get(https_params)
 
-        if datatype == "csv":
-            return response.text
+    if datatype == "csv":
+        return _csv_text(response)
 
-        # For JSON responses, apply response limiting to prevent token issues
-        full_response = response.json()
+    # For JSON responses, apply response limiting to prevent token issues
+    full_response = await _parse_json(response.content)
 
-        # Apply simple response limiting for large time series data
-        if "Technical Analysis: SMA" in full_response and max_data_points:
-            time_series_data = full_response["Technical Analysis: SMA"]
-            if len(time_series_data) > max_data_points:
-                # Get the most recent data points
-                sorted_dates = sorted(time_series_data.keys(), reverse=True)
-                limited_data = {
-                    date: time_series_data[date]
-                    for date in sorted_dates[:max_data_points]
-                }
-                full_response["Technical Analysis: SMA"] = limited_data
+    # Apply simple response limiting for large time series data
+    if "Technical Analysis: SMA" in full_response and max_data_points:
+        time_series_data = full_response["Technical Analysis: SMA"]
+        if len(time_series_data) > max_data_points:
+            # Get the most recent data points
+            sorted_dates = sorted(time_series_data.keys(), reverse=True)
+            limited_data = {
+                date: time_series_data[date] for date in sorted_dates[:max_data_points]
+            }
+            full_response["Technical Analysis: SMA"] = limited_data
 
-        return full_response
+    return full_response
 
 
 async def fetch_ema(
@@ -0,0 +1,270 @@
+"""Response caching for the Alpha Vantage tool handlers.
+
+Results are kept in a bounded in-process LRU by default. Setting ``REDIS_URL``
+(and installing the optional ``redis`` extra) shares the cache between server
+processes instead, with recently used entries still held in process for a short
+time so hot keys do not cost a Redis round trip. Payloads stored in Redis are
+zstd-compressed when the optional ``zstandard`` package is installed.
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from .api_helpers import is_notice
+from .json_utils import json_dumps, json_loads
+from .metrics import record_cache_lookup
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger("AlphaVantageMCP")
+
+_MISSING = object()
+
+# Frame header of zstd-compressed payloads; JSON text never starts with it
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Maximum number of results held in process, least recently used evicted first
+MAX_LOCAL_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "4096"))
+# With Redis, results are also kept in process for at most this many seconds
+LOCAL_TTL = 30
+
+# key -> (expires_at, value), using time.monotonic() timestamps
+_CACHE: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_LOCKS: dict[str, asyncio.Lock] = {}
+# Number of callers holding or waiting for each lock in _LOCKS
+_LOCK_USERS: dict[str, int] = {}
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+def _cache_get(key: str) -> Any:
+    """Return the cached value for ``key`` or ``_MISSING`` if absent or expired."""
+    entry = _CACHE.get(key)
+    if entry is None:
+        return _MISSING
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _CACHE.pop(key, None)
+        return _MISSING
+    _CACHE.move_to_end(key)
+    return value
+
+
+def _cache_set(key: str, value: Any, ttl: float) -> None:
+    _CACHE[key] = (time.monotonic() + ttl, value)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > MAX_LOCAL_ENTRIES:
+        _CACHE.popitem(last=False)
+
+
+class MemoryCache:
+    """Process-local cache backend (the default)."""
+
+    async def get(self, key: str) -> Any:
+        return _cache_get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        _cache_set(key, value, ttl)
+
+
+class RedisCache:
+    """Cache backend storing JSON-encoded (optionally compressed) results in Redis."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url)
+        if zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=3)
+            self._decompressor = zstandard.ZstdDecompressor()
+        else:
+            self._compressor = self._decompressor = None
+
+    def _encode(self, value: Any) -> bytes:
+        payload = json_dumps(value)
+        if self._compressor is not None:
+            payload = self._compressor.compress(payload)
+        return payload
+
+    def _decode(self, payload: bytes) -> Any:
+        if payload[:4] == _ZSTD_MAGIC:
+            if self._decompressor is None:
+                # Written by a process with zstandard installed
+                return _MISSING
+            payload = self._decompressor.decompress(payload)
+        return json_loads(payload)
+
+    async def get(self, key: str) -> Any:
+        value = _cache_get(key)
+        if value is not _MISSING:
+            return value
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                payload, ttl_ms = await pipe.get(key).pttl(key).execute()
+        except Exception as e:
+            logger.warning(f"Redis cache read failed for {key}: {e}")
+            return _MISSING
+        if payload is None:
+            return _MISSING
+        try:
+            value = self._decode(payload)
+        except Exception as e:
+            # A corrupt or unreadable entry is treated as a miss and overwritten
+            logger.warning(f"Redis cache entry for {key} could not be decoded: {e}")
+            return _MISSING
+        if value is _MISSING:
+            return _MISSING
+        # Never keep a local copy past the Redis expiry
+        if ttl_ms > 0:
+            _cache_set(key, value, min(LOCAL_TTL, ttl_ms / 1000))
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        _cache_set(key, value, min(LOCAL_TTL, ttl))
+        try:
+            await self._client.set(key, self._encode(value), ex=max(1, int(ttl)))
+        except Exception as e:
+            logger.warning(f"Redis cache write failed for {key}: {e}")
+
+
+_backend: Optional[MemoryCache | RedisCache] = None
+
+
+def get_cache_backend() -> MemoryCache | RedisCache:
+    """Return the configured cache backend, creating it on first use."""
+    global _backend
+    if _backend is None:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                _backend = RedisCache(redis_url)
+            except ImportError:
+                logger.warning("REDIS_URL is set but redis is not installed")
+        if _backend is None:
+            _backend = MemoryCache()
+    return _backend
+
+
+def set_cache_backend(backend: Optional[MemoryCache | RedisCache]) -> None:
+    """Override the cache backend (``None`` re-reads the environment)."""
+    global _backend
+    _backend = backend
+
+
+class Uncached:
+    """A result for ``cached_call`` to return without storing it."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _make_key(name: str, args: tuple, kwargs: dict) -> str:
+    payload = json_dumps([args, kwargs], sort_keys=True)
+    return f"av:{name}:" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _is_cacheable(value: Any) -> bool:
+    """
+    Return False for Alpha Vantage rate-limit notices and error payloads.
+
+    Notices are also looked for one level down, where handlers that combine
+    several responses (or keep the ``raw_data``) would carry them.
+    """
+    if not isinstance(value, dict):
+        return True
+    return not (is_notice(value) or any(map(is_notice, value.values())))
+
+
+async def cached_call(
+    name: str, ttl: float, func: Callable[..., Awaitable[Any]], *args, **kwargs
+) -> Any:
+    """
+    Return the cached result of ``func(*args, **kwargs)``, computing it on a miss.
+
+    Results are stored under ``name`` and the call arguments for ``ttl``
+    seconds, unless ``func`` wraps one in ``Uncached``. Concurrent calls with
+    the same arguments share a lock, so only the first one reaches the Alpha
+    Vantage API while the rest wait for its result.
+    """
+    key = _make_key(name, args, kwargs)
+    backend = get_cache_backend()
+
+    value = await backend.get(key)
+    if value is not _MISSING:
+        record_cache_lookup(name, hit=True)
+        return value
+
+    lock = _LOCKS.setdefault(key, asyncio.Lock())
+    _LOCK_USERS[key] = _LOCK_USERS.get(key, 0) + 1
+    try:
+        async with lock:
+            value = await backend.get(key)
+            record_cache_lookup(name, hit=value is not _MISSING)
+            if value is _MISSING:
+                value = await func(*args, **kwargs)
+                if isinstance(value, Uncached):
+                    return value.value
+                if _is_cacheable(value):
+                    await backend.set(key, value, ttl)
+            return value
+    finally:
+        # Drop the lock only once no other caller holds or waits for it
+        _LOCK_USERS[key] -= 1
+        if not _LOCK_USERS[key]:
+            del _LOCK_USERS[key], _LOCKS[key]
+
+
+def async_ttl_cache(
+    ttl: float = 60,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache the results of a coroutine function for ``ttl`` seconds.
+
+    See ``cached_call`` for how concurrent misses are handled.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await cached_call(func.__name__, ttl, func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def shared_call(
+    name: str, func: Callable[..., Awaitable[Any]], *args, **kwargs
+) -> Any:
+    """
+    Share one in-flight ``func(*args, **kwargs)`` between concurrent callers.
+
+    Unlike ``cached_call`` nothing is kept once the call finishes; callers
+    that arrive while it is running simply await the same result, or the
+    same exception.
+    """
+    key = _make_key(name, args, kwargs)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        _INFLIGHT[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            _INFLIGHT.pop(key, None)
+            # Mark the exception as retrieved if every caller went away
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+    # Shield so one caller being cancelled does not cancel the others
+    return await asyncio.shield(task)
@@ -0,0 +1,165 @@
+"""Routing of MCP tool calls to their handler functions."""
+
+import asyncio
+import logging
+import sys
+import time
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .cache import cached_call, shared_call
+from .handlers import TOOL_FUNCTIONS
+from .metrics import observe_tool_call
+
+logger = logging.getLogger("AlphaVantageMCP")
+
+
+class CachePolicy(IntEnum):
+    """How long dispatch caches a tool's results, in seconds."""
+
+    NONE = 0  # not cached here
+    SHORT = 60
+    MEDIUM = 5 * 60
+    HOUR = 60 * 60
+    LONG = 24 * 60 * 60
+
+
+# Cache policy of every registered tool. Tools marked NONE either make no
+# upstream call or cache inside their handlers already (financial statements,
+# market calendar, listing status, indicator packs); the latter still share
+# concurrent identical calls.
+CACHE_POLICIES: Dict[str, CachePolicy] = {
+    # Quotes and market status
+    "get_current_stock_quote": CachePolicy.SHORT,
+    "get_bulk_quotes": CachePolicy.SHORT,
+    "get_global_markets_status": CachePolicy.SHORT,
+    "get_current_fx_rate": CachePolicy.SHORT,
+    "get_current_crypto_quote": CachePolicy.SHORT,
+    # Time series, news and analytics
+    "get_stock_time_series": CachePolicy.MEDIUM,
+    "get_fx_time_series": CachePolicy.MEDIUM,
+    "get_crypto_time_series": CachePolicy.MEDIUM,
+    "get_news_sentiment": CachePolicy.MEDIUM,
+    "analyze_stocks": CachePolicy.MEDIUM,
+    "get_top_gainers_losers": CachePolicy.NONE,
+    # Options, insider activity, earnings and commodities
+    "get_historical_options": CachePolicy.HOUR,
+    "get_stock_insider_transactions": CachePolicy.HOUR,
+    "get_earning_data": CachePolicy.HOUR,
+    "get_commodities": CachePolicy.HOUR,
+    # Reference and fundamental data
+    "lookup_stock_symbol": CachePolicy.LONG,
+    "get_symbol_overview": CachePolicy.LONG,
+    "get_corporate_actions": CachePolicy.LONG,
+    "get_financial_statements": CachePolicy.NONE,
+    "get_market_calendar": CachePolicy.NONE,
+    "get_listing_status": CachePolicy.NONE,
+    # Economic indicators
+    "get_growth_metrics": CachePolicy.LONG,
+    "get_rates_yields": CachePolicy.LONG,
+    "get_prices_inflation": CachePolicy.LONG,
+    "get_labor_activity": CachePolicy.LONG,
+    # Technical indicators
+    "get_trend_indicators": CachePolicy.NONE,
+    "get_momentum_indicators": CachePolicy.NONE,
+    "get_volatility_indicators": CachePolicy.NONE,
+    "get_volume_indicators": CachePolicy.NONE,
+}
+
+# Tools that make no upstream call, called directly without any bookkeeping
+_LOCAL_TOOLS = frozenset({"get_top_gainers_losers"})
+
+# Tool names are interned and mapped once to a position in the handler tuple
+_TOOL_NAMES = tuple(sys.intern(name) for name in TOOL_FUNCTIONS)
+_TOOL_HANDLERS = tuple(TOOL_FUNCTIONS.values())
+_TOOL_POLICIES = tuple(CACHE_POLICIES[name] for name in _TOOL_NAMES)
+_TOOL_INDEX = {name: index for index, name in enumerate(_TOOL_NAMES)}
+
+
+def is_known_tool(name: str) -> bool:
+    """Return whether ``name`` is a registered tool."""
+    return name in _TOOL_INDEX
+
+
+async def _call_cached(name: str, /, **arguments: Any) -> Any:
+    index = _TOOL_INDEX[name]
+    policy = _TOOL_POLICIES[index]
+    if policy is CachePolicy.NONE:
+        return await _TOOL_HANDLERS[index](**arguments)
+    return await cached_call(name, policy, _TOOL_HANDLERS[index], **arguments)
+
+
+async def dispatch(name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Call the handler registered for the tool ``name``.
+
+    Concurrent identical calls share one execution, and unless a tool's cache
+    policy is ``NONE`` its results are served from the response cache while
+    fresh.
+
+    Args:
+        name: Tool name as sent by the MCP client
+        arguments: Keyword arguments for the handler
+
+    Returns:
+        The handler's result
+    """
+    name = sys.intern(name)
+    index = _TOOL_INDEX.get(name)
+    if index is None:
+        raise ValueError(f"Unknown tool: {name}")
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        if name in _LOCAL_TOOLS:
+            result = await _TOOL_HANDLERS[index](**(arguments or {}))
+        else:
+            result = await shared_call(name, _call_cached, name, **(arguments or {}))
+        outcome = "ok"
+        return result
+    finally:
+        observe_tool_call(name, outcome, time.perf_counter() - started)
+
+
+async def dispatch_many(
+    calls: Iterable[Tuple[str, Optional[Dict[str, Any]]]], max_workers: int = 5
+) -> List[Any]:
+    """
+    Run several independent tool calls concurrently.
+
+    Args:
+        calls: ``(name, arguments)`` pairs, as passed to ``dispatch``
+        max_workers: Maximum number of tool calls running at once
+
+    Returns:
+        Results in the order of ``calls``; a failed call yields its exception
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def _bounded(name: str, arguments: Optional[Dict[str, Any]]) -> Any:
+        async with semaphore:
+            return await dispatch(name, arguments)
+
+    return await asyncio.gather(
+        *(_bounded(name, arguments) for name, arguments in calls),
+        return_exceptions=True,
+    )
+
+
+async def warm_cache(symbols: Iterable[str]) -> None:
+    """
+    Prime the response cache with lookups and company overviews for ``symbols``.
+
+    Args:
+        symbols: Ticker symbols expected to be requested often
+    """
+    calls = []
+    for symbol in symbols:
+        calls.append(("lookup_stock_symbol", {"keywords": symbol}))
+        calls.append(
+            ("get_symbol_overview", {"symbol": symbol, "profile_type": "company"})
+        )
+    results = await dispatch_many(calls)
+    failed = sum(isinstance(result, Exception) for result in results)
+    if failed:
+        logger.warning(f"Cache warm-up failed for {failed} of {len(calls)} calls")
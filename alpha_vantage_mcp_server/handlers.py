@@ -1,4 +1,21 @@
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import csv
+import io
+import re
+from functools import lru_cache
+from itertools import islice, product
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from .api_helpers import (
     # Time series functions
@@ -68,6 +85,7 @@ from .api_helpers import (
     fetch_ht_dcphase,
     fetch_ht_phasor,
     # Other functions we want to keep
+    fetch_quote,
     fetch_realtime_bulk_quotes,
     search_endpoint,
     fetch_market_status,
@@ -105,7 +123,150 @@ from .api_helpers import (
     fetch_durables,
     fetch_unemployment,
     fetch_nonfarm_payrolls,
+    INDICATOR_TIMEOUT,
+    PARSE_IN_THREAD_THRESHOLD,
+    request_timeout,
 )
+from .cache import Uncached, async_ttl_cache
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+_INTRADAY = frozenset({"1min", "5min", "15min", "30min", "60min"})
+
+# (interval, adjusted) -> fetcher for daily, weekly and monthly stock series
+_TS_FUNCS = {
+    ("daily", False): fetch_time_series_daily,
+    ("daily", True): fetch_time_series_daily_adjusted,
+    ("weekly", False): fetch_time_series_weekly,
+    ("weekly", True): fetch_time_series_weekly_adjusted,
+    ("monthly", False): fetch_time_series_monthly,
+    ("monthly", True): fetch_time_series_monthly_adjusted,
+}
+_VALID_INTERVALS = frozenset({"daily", "weekly", "monthly"}) | _INTRADAY
+
+_CAMEL_RE1 = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_RE2 = re.compile(r"([a-z0-9])([A-Z])")
+
+# Known Alpha Vantage earnings fields; unknown keys fall back to _camel_to_snake
+_EARNINGS_FIELDS = {
+    "fiscalDateEnding": "fiscal_date_ending",
+    "reportedDate": "reported_date",
+    "reportedEPS": "reported_eps",
+    "estimatedEPS": "estimated_eps",
+    "surprise": "surprise",
+    "surprisePercentage": "surprise_percentage",
+    "reportTime": "report_time",
+    "reportedCurrency": "reported_currency",
+}
+
+# (Alpha Vantage key, snake_case key) pairs used to normalize API responses
+_FX_RATE_KEYS = (
+    ("1. From_Currency Code", "from_currency_code"),
+    ("2. From_Currency Name", "from_currency_name"),
+    ("3. To_Currency Code", "to_currency_code"),
+    ("4. To_Currency Name", "to_currency_name"),
+    ("5. Exchange Rate", "exchange_rate"),
+    ("6. Last Refreshed", "last_refreshed"),
+    ("7. Time Zone", "time_zone"),
+    ("8. Bid Price", "bid_price"),
+    ("9. Ask Price", "ask_price"),
+)
+_FX_METADATA_KEYS = (
+    ("1. Information", "information"),
+    ("2. From Symbol", "from_symbol"),
+    ("3. To Symbol", "to_symbol"),
+    ("4. Output Size", "output_size"),
+    ("5. Last Refreshed", "last_refreshed"),
+    ("6. Time Zone", "time_zone"),
+    ("7. Interval", "interval"),
+)
+_FX_VALUE_KEYS = (
+    ("1. open", "open"),
+    ("2. high", "high"),
+    ("3. low", "low"),
+    ("4. close", "close"),
+)
+_CRYPTO_METADATA_KEYS = (
+    ("1. Information", "information"),
+    ("2. Digital Currency Code", "symbol"),
+    ("3. Digital Currency Name", "name"),
+    ("4. Market Code", "market"),
+    ("5. Market Name", "market_name"),
+    ("6. Last Refreshed", "last_refreshed"),
+    ("7. Interval", "interval"),
+    ("8. Output Size", "output_size"),
+    ("9. Time Zone", "time_zone"),
+)
+_CRYPTO_VALUE_KEYS = _FX_VALUE_KEYS + (("5. volume", "volume"),)
+_STOCK_METADATA_KEYS = (
+    ("1. Information", "information"),
+    ("2. Symbol", "symbol"),
+    ("3. Last Refreshed", "last_refreshed"),
+    ("4. Output Size", "output_size"),
+    ("5. Time Zone", "time_zone"),
+)
+# Adjusted series report volume as "6. volume" after "5. adjusted close"
+_STOCK_VALUE_KEYS = _FX_VALUE_KEYS + (
+    ("5. adjusted close", "adjusted_close"),
+    ("5. volume", "volume"),
+    ("6. volume", "volume"),
+    ("7. dividend amount", "dividend_amount"),
+    ("8. split coefficient", "split_coefficient"),
+)
+_GLOBAL_QUOTE_KEYS = (
+    ("01. symbol", "symbol"),
+    ("02. open", "open"),
+    ("03. high", "high"),
+    ("04. low", "low"),
+    ("05. price", "price"),
+    ("06. volume", "volume"),
+    ("07. latest trading day", "latest_trading_day"),
+    ("08. previous close", "previous_close"),
+    ("09. change", "change"),
+    ("10. change percent", "change_percent"),
+)
+_SYMBOL_MATCH_KEYS = (
+    ("1. symbol", "symbol"),
+    ("2. name", "name"),
+    ("3. type", "type"),
+    ("4. region", "region"),
+    ("5. marketOpen", "market_open"),
+    ("6. marketClose", "market_close"),
+    ("7. timezone", "timezone"),
+    ("8. currency", "currency"),
+    ("9. matchScore", "match_score"),
+)
+
+# Names of the time series object in each response, by request interval
+_STOCK_SERIES_KEYS = {
+    ("daily", False): "Time Series (Daily)",
+    ("daily", True): "Time Series (Daily)",
+    ("weekly", False): "Weekly Time Series",
+    ("weekly", True): "Weekly Adjusted Time Series",
+    ("monthly", False): "Monthly Time Series",
+    ("monthly", True): "Monthly Adjusted Time Series",
+    **{
+        (interval, adjusted): f"Time Series ({interval})"
+        for interval in _INTRADAY
+        for adjusted in (False, True)
+    },
+}
+_FX_SERIES_KEYS = {
+    **{interval: f"Time Series FX ({interval})" for interval in _INTRADAY},
+    "daily": "Time Series FX (Daily)",
+    "weekly": "Time Series FX (Weekly)",
+    "monthly": "Time Series FX (Monthly)",
+}
+_CRYPTO_SERIES_KEYS = {
+    **{interval: f"Time Series Crypto ({interval})" for interval in _INTRADAY},
+    "daily": "Time Series (Digital Currency Daily)",
+    "weekly": "Time Series (Digital Currency Weekly)",
+    "monthly": "Time Series (Digital Currency Monthly)",
+}
 
 
 async def fetch_time_series(
@@ -132,10 +293,11 @@ async def fetch_time_series(
     Returns:
         Time series data in JSON format
     """
+    if interval not in _VALID_INTERVALS:
+        raise ValueError(f"Unsupported interval: {interval}")
 
     # Handle intraday intervals
-    intraday_intervals = ["1min", "5min", "15min", "30min", "60min"]
-    if interval in intraday_intervals:
+    if interval in _INTRADAY:
         return await fetch_intraday(
             symbol=symbol,
             interval=interval,
@@ -146,19 +308,7 @@ async def fetch_time_series(
             month=month,
         )
 
-    # Function mapping for daily, weekly, monthly intervals
-    function_map = {
-        ("daily", False): fetch_time_series_daily,
-        ("daily", True): fetch_time_series_daily_adjusted,
-        ("weekly", False): fetch_time_series_weekly,
-        ("weekly", True): fetch_time_series_weekly_adjusted,
-        ("monthly", False): fetch_time_series_monthly,
-        ("monthly", True): fetch_time_series_monthly_adjusted,
-    }
-
-    func = function_map.get((interval, adjusted))
-    if not func:
-        raise ValueError(f"Unsupported interval: {interval}")
+    func = _TS_FUNCS[interval, bool(adjusted)]
 
     # Call the appropriate function
     if interval == "daily":
@@ -167,45 +317,115 @@ async def fetch_time_series(
         return await func(symbol=symbol, datatype="json")
 
 
-def _normalize_timestamp(timestamp: str, interval: str) -> str:
-    """
-    Normalize timestamp to YYYY-MM-DD HH:MM:SS format.
-    For daily data, append ' 00:00:00' for consistency.
-    For intraday data, ensure proper HH:MM:SS format.
-    """
-    if interval in ["daily", "weekly", "monthly"]:
-        # Daily data: append time component
-        if len(timestamp) == 10:  # YYYY-MM-DD
-            return f"{timestamp} 00:00:00"
-        else:
-            return timestamp
-    else:
-        # Intraday data: ensure HH:MM:SS format
-        if len(timestamp) == 16:  # YYYY-MM-DD HH:MM
-            return f"{timestamp}:00"
-        elif len(timestamp) == 19:  # YYYY-MM-DD HH:MM:SS
-            return timestamp
+def _iter_indicator_rows(
+    indicator_name: str,
+    items_map: Dict[str, Dict[str, Any]],
+    is_daily: bool,
+    use_component_key: bool,
+    limit: int,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the flattened rows of a single indicator's timestamp -> values map."""
+    indicator_key = indicator_name.lower()
+    # Component names repeat on every row, so each is built once and shared
+    components: Dict[str, str] = {}
+    for timestamp, values in islice(items_map.items(), limit):
+        if is_daily:
+            ts = timestamp if len(timestamp) != 10 else f"{timestamp} 00:00:00"
+        elif len(timestamp) == 16:
+            ts = f"{timestamp}:00"
+        elif len(timestamp) == 19:
+            ts = timestamp
         else:
-            return f"{timestamp} 00:00:00"
+            ts = f"{timestamp} 00:00:00"
+        for key, value in values.items():
+            component = components.get(key)
+            if component is None:
+                component = key.lower() if use_component_key else "value"
+                components[key] = component
+            yield {
+                "timestamp": ts,
+                "indicator": indicator_key,
+                "component": component,
+                "value": value,
+            }
 
 
-async def get_trend_indicators(
-    symbol: str, interval: str, preset: str = "standard", **params
-) -> Dict[str, Any]:
+async def _iter_indicator_pack(
+    fetches: Dict[str, Awaitable[Any]],
+    interval: str,
+    multi_component: set[str],
+    limit: int = 20,
+    missing: Optional[List[str]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Get trend indicators pack: SMA, EMA, WMA, MACD with preset configurations.
+    Fetch an indicator pack concurrently and yield its flattened rows.
 
-    Args:
-        symbol: The stock symbol to analyze
-        interval: Time interval for the data
-        preset: Preset configuration ('fast', 'standard', 'slow')
+    Rows are yielded in pack order as soon as each indicator's response is
+    available, so consumers can start before the whole pack has arrived.
+    Indicators whose request fails or takes longer than ``INDICATOR_TIMEOUT``
+    seconds are left out, so one slow response cannot hold up the rest of the
+    pack. If every indicator fails, the first error is raised instead.
 
-    Returns:
-        Trend indicators data with all indicators in the pack
+    Args:
+        fetches: Mapping of indicator name to its pending API request
+        interval: Time interval of the data (controls timestamp normalization)
+        multi_component: Indicators whose values have several components (e.g. MACD)
+        limit: Maximum number of timestamps kept per indicator
+        missing: If given, the names of left out indicators are appended to it
+
+    Yields:
+        Rows with timestamps normalized to YYYY-MM-DD HH:MM:SS
     """
+    is_daily = interval in ("daily", "weekly", "monthly")
+    # The tasks inherit the timeout, which only starts once a request is sent
+    with request_timeout(INDICATOR_TIMEOUT):
+        tasks = {name: asyncio.ensure_future(fetch) for name, fetch in fetches.items()}
+    first_error: Optional[Exception] = None
+    succeeded = False
+    try:
+        for indicator_name, task in tasks.items():
+            # Failed or timed-out indicators are skipped rather than failing the pack
+            try:
+                data = await task
+            except Exception as e:
+                first_error = first_error or e
+                if missing is not None:
+                    missing.append(indicator_name)
+                continue
+            succeeded = True
+            items_map = data.get("items") if isinstance(data, dict) else None
+            if items_map is None:
+                continue
+            for row in _iter_indicator_rows(
+                indicator_name,
+                items_map,
+                is_daily,
+                indicator_name in multi_component,
+                limit,
+            ):
+                yield row
+        if first_error is not None and not succeeded:
+            raise first_error
+    finally:
+        for task in tasks.values():
+            task.cancel()
+
+
+def _frozen_presets(presets: Dict[str, Any]) -> MappingProxyType:
+    """Wrap a nested preset configuration in read-only mappings."""
+    return MappingProxyType(
+        {
+            key: _frozen_presets(value) if isinstance(value, dict) else value
+            for key, value in presets.items()
+        }
+    )
+
+
+# Parameters shared by every indicator computed on closing prices
+_CLOSE_SERIES = MappingProxyType({"series_type": "close"})
 
-    # Define presets configuration
-    presets = {
+_TREND_PRESETS = _frozen_presets(
+    {
         "fast": {
             "SMA": {"time_period": 10},
             "EMA": {"time_period": 10},
@@ -225,68 +445,54 @@ async def get_trend_indicators(
             "MACD": {"fastperiod": 19, "slowperiod": 39, "signalperiod": 9},
         },
     }
+)
 
-    common = {"series_type": "close"}
-    preset_config = presets.get(preset, presets["standard"])
 
-    # Fetch all indicators with their specific parameters
-    indicators = {}
-    indicators["SMA"] = await fetch_sma(
-        symbol=symbol, interval=interval, **preset_config["SMA"], **common
-    )
-    indicators["EMA"] = await fetch_ema(
-        symbol=symbol, interval=interval, **preset_config["EMA"], **common
-    )
-    indicators["WMA"] = await fetch_wma(
-        symbol=symbol, interval=interval, **preset_config["WMA"], **common
-    )
-    indicators["MACD"] = await fetch_macd(
-        symbol=symbol, interval=interval, **preset_config["MACD"], **common
-    )
+async def iter_trend_indicators(
+    symbol: str,
+    interval: str,
+    preset: str = "standard",
+    missing: Optional[List[str]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield trend indicator rows as each indicator's data arrives.
 
-    # Transform to unified format with max 20 items per indicator
-    items = []
-    for indicator_name, data in indicators.items():
-        if isinstance(data, dict) and "items" in data:
-            count = 0
-            for timestamp, values in data["items"].items():
-                if count >= 20:
-                    break
-                if indicator_name == "MACD":
-                    # MACD has multiple values
-                    for key, value in values.items():
-                        items.append(
-                            {
-                                "timestamp": _normalize_timestamp(timestamp, interval),
-                                "indicator": "macd",
-                                "component": key.lower(),
-                                "value": value,
-                            }
-                        )
-                else:
-                    # Single value indicators
-                    for key, value in values.items():
-                        items.append(
-                            {
-                                "timestamp": _normalize_timestamp(timestamp, interval),
-                                "indicator": indicator_name.lower(),
-                                "component": "value",
-                                "value": value,
-                            }
-                        )
-                count += 1
+    Args:
+        symbol: The stock symbol to analyze
+        interval: Time interval for the data
+        preset: Preset configuration ('fast', 'standard', 'slow')
+        missing: If given, the names of indicators left out are appended to it
 
-    return {
-        "metadata": {"symbol": symbol, "interval": interval, "preset": preset},
-        "items": items,
+    Yields:
+        Flattened timestamp/indicator/component rows
+    """
+
+    preset_config = _TREND_PRESETS.get(preset, _TREND_PRESETS["standard"])
+
+    fetches = {
+        "SMA": fetch_sma(
+            symbol=symbol, interval=interval, **preset_config["SMA"], **_CLOSE_SERIES
+        ),
+        "EMA": fetch_ema(
+            symbol=symbol, interval=interval, **preset_config["EMA"], **_CLOSE_SERIES
+        ),
+        "WMA": fetch_wma(
+            symbol=symbol, interval=interval, **preset_config["WMA"], **_CLOSE_SERIES
+        ),
+        "MACD": fetch_macd(
+            symbol=symbol, interval=interval, **preset_config["MACD"], **_CLOSE_SERIES
+        ),
     }
+    async for row in _iter_indicator_pack(fetches, interval, {"MACD"}, missing=missing):
+        yield row
 
 
-async def get_momentum_indicators(
+@async_ttl_cache(ttl=60)
+async def get_trend_indicators(
     symbol: str, interval: str, preset: str = "standard", **params
 ) -> Dict[str, Any]:
     """
-    Get momentum indicators pack: RSI, STOCH, CCI, MFI with preset configurations.
+    Get trend indicators pack: SMA, EMA, WMA, MACD with preset configurations.
 
     Args:
         symbol: The stock symbol to analyze
@@ -294,11 +500,23 @@ async def get_momentum_indicators(
         preset: Preset configuration ('fast', 'standard', 'slow')
 
     Returns:
-        Momentum indicators data with all indicators in the pack
+        Trend indicators data with all indicators in the pack
     """
 
-    # Define presets configuration
-    presets = {
+    missing: List[str] = []
+    result = {
+        "metadata": {"symbol": symbol, "interval": interval, "preset": preset},
+        "items": [
+            row
+            async for row in iter_trend_indicators(symbol, interval, preset, missing)
+        ],
+    }
+    # Incomplete packs are returned but not cached
+    return Uncached(result) if missing else result
+
+
+_MOMENTUM_PRESETS = _frozen_presets(
+    {
         "fast": {
             "RSI": {"time_period": 7},
             "STOCH": {
@@ -336,68 +554,52 @@ async def get_momentum_indicators(
             "MFI": {"time_period": 21},
         },
     }
+)
 
-    common = {"series_type": "close"}
-    preset_config = presets.get(preset, presets["standard"])
 
-    # Fetch all indicators with their specific parameters
-    indicators = {}
-    indicators["RSI"] = await fetch_rsi(
-        symbol=symbol, interval=interval, **preset_config["RSI"], **common
-    )
-    indicators["STOCH"] = await fetch_stoch(
-        symbol=symbol, interval=interval, **preset_config["STOCH"]
-    )
-    indicators["CCI"] = await fetch_cci(
-        symbol=symbol, interval=interval, **preset_config["CCI"]
-    )
-    indicators["MFI"] = await fetch_mfi(
-        symbol=symbol, interval=interval, **preset_config["MFI"]
-    )
+async def iter_momentum_indicators(
+    symbol: str,
+    interval: str,
+    preset: str = "standard",
+    missing: Optional[List[str]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield momentum indicator rows as each indicator's data arrives.
 
-    # Transform to unified format with max 20 items per indicator
-    items = []
-    for indicator_name, data in indicators.items():
-        if isinstance(data, dict) and "items" in data:
-            count = 0
-            for timestamp, values in data["items"].items():
-                if count >= 20:
-                    break
-                if indicator_name == "STOCH":
-                    # STOCH has multiple values (fastk, fastd, slowk, slowd)
-                    for key, value in values.items():
-                        items.append(
-                            {
-                                "timestamp": _normalize_timestamp(timestamp, interval),
-                                "indicator": "stoch",
-                                "component": key.lower(),
-                                "value": value,
-                            }
-                        )
-                else:
-                    # Single value indicators
-                    for key, value in values.items():
-                        items.append(
-                            {
-                                "timestamp": _normalize_timestamp(timestamp, interval),
-                                "indicator": indicator_name.lower(),
-                                "component": "value",
-                                "value": value,
-                            }
-                        )
-                count += 1
+    Args:
+        symbol: The stock symbol to analyze
+        interval: Time interval for the data
+        preset: Preset configuration ('fast', 'standard', 'slow')
+        missing: If given, the names of indicators left out are appended to it
 
-    return {
-        "metadata": {"symbol": symbol, "interval": interval, "preset": preset},
-        "items": items,
+    Yields:
+        Flattened timestamp/indicator/component rows
+    """
+
+    preset_config = _MOMENTUM_PRESETS.get(preset, _MOMENTUM_PRESETS["standard"])
+
+    fetches = {
+        "RSI": fetch_rsi(
+            symbol=symbol, interval=interval, **preset_config["RSI"], **_CLOSE_SERIES
+        ),
+        "STOCH": fetch_stoch(
+            symbol=symbol, interval=interval, **preset_config["STOCH"]
+        ),
+        "CCI": fetch_cci(symbol=symbol, interval=interval, **preset_config["CCI"]),
+        "MFI": fetch_mfi(symbol=symbol, interval=interval, **preset_config["MFI"]),
     }
+    async for row in _iter_indicator_pack(
+        fetches, interval, {"STOCH"}, missing=missing
+    ):
+        yield row
 
 
-async def get_volatility_indicators(
+@async_ttl_cache(ttl=60)
+async def get_momentum_indicators(
     symbol: str, interval: str, preset: str = "standard", **params
 ) -> Dict[str, Any]:
     """
-    Get volatility indicators pack: BBANDS, ATR, SAR with preset configurations.
+    Get momentum indicators pack: RSI, STOCH, CCI, MFI with preset configurations.
 
     Args:
         symbol: The stock symbol to analyze
@@ -405,11 +607,23 @@ async def get_volatility_indicators(
         preset: Preset configuration ('fast', 'standard', 'slow')
 
     Returns:
-        Volatility indicators data with all indicators in the pack
+        Momentum indicators data with all indicators in the pack
     """
 
-    # Define presets configuration
-    presets = {
+    missing: List[str] = []
+    result = {
+        "metadata": {"symbol": symbol, "interval": interval, "preset": preset},
+        "items": [
+            row
+            async for row in iter_momentum_indicators(symbol, interval, preset, missing)
+        ],
+    }
+    # Incomplete packs are returned but not cached
+    return Uncached(result) if missing else result
+
+
+_VOLATILITY_PRESETS = _frozen_presets(
+    {
         "fast": {
             "BBANDS": {"time_period": 14, "nbdevup": 2, "nbdevdn": 2, "matype": 0},
             "ATR": {"time_period": 7},
@@ -426,65 +640,49 @@ async def get_volatility_indicators(
             "SAR": {"acceleration": 0.01, "maximum": 0.10},
         },
     }
+)
 
-    common = {"series_type": "close"}
-    preset_config = presets.get(preset, presets["standard"])
 
-    # Fetch all indicators with their specific parameters
-    indicators = {}
-    indicators["BBANDS"] = await fetch_bbands(
-        symbol=symbol, interval=interval, **preset_config["BBANDS"], **common
-    )
-    indicators["ATR"] = await fetch_atr(
-        symbol=symbol, interval=interval, **preset_config["ATR"]
-    )
-    indicators["SAR"] = await fetch_sar(
-        symbol=symbol, interval=interval, **preset_config["SAR"]
-    )
+async def iter_volatility_indicators(
+    symbol: str,
+    interval: str,
+    preset: str = "standard",
+    missing: Optional[List[str]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield volatility indicator rows as each indicator's data arrives.
 
-    # Transform to unified format with max 20 items per indicator
-    items = []
-    for indicator_name, data in indicators.items():
-        if isinstance(data, dict) and "items" in data:
-            count = 0
-            for timestamp, values in data["items"].items():
-                if count >= 20:
-                    break
-                if indicator_name == "BBANDS":
-                    # BBANDS has multiple values (upper, middle, lower bands)
-                    for key, value in values.items():
-                        items.append(
-                            {
-                                "timestamp": _normalize_timestamp(timestamp, interval),
-                                "indicator": "bbands",
-                                "component": key.lower(),
-                                "value": value,
-                            }
-                        )
-                else:
-                    # Single value indicators
-                    for key, value in values.items():
-                        items.append(
-                            {
-                                "timestamp": _normalize_timestamp(timestamp, interval),
-                                "indicator": indicator_name.lower(),
-                                "component": "value",
-                                "value": value,
-                            }
-                        )
-                count += 1
+    Args:
+        symbol: The stock symbol to analyze
+        interval: Time interval for the data
+        preset: Preset configuration ('fast', 'standard', 'slow')
+        missing: If given, the names of indicators left out are appended to it
 
-    return {
-        "metadata": {"symbol": symbol, "interval": interval, "preset": preset},
-        "items": items,
+    Yields:
+        Flattened timestamp/indicator/component rows
+    """
+
+    preset_config = _VOLATILITY_PRESETS.get(preset, _VOLATILITY_PRESETS["standard"])
+
+    fetches = {
+        "BBANDS": fetch_bbands(
+            symbol=symbol, interval=interval, **preset_config["BBANDS"], **_CLOSE_SERIES
+        ),
+        "ATR": fetch_atr(symbol=symbol, interval=interval, **preset_config["ATR"]),
+        "SAR": fetch_sar(symbol=symbol, interval=interval, **preset_config["SAR"]),
     }
+    async for row in _iter_indicator_pack(
+        fetches, interval, {"BBANDS"}, missing=missing
+    ):
+        yield row
 
 
-async def get_volume_indicators(
+@async_ttl_cache(ttl=60)
+async def get_volatility_indicators(
     symbol: str, interval: str, preset: str = "standard", **params
 ) -> Dict[str, Any]:
     """
-    Get volume indicators pack: OBV, AD, ADOSC with preset configurations.
+    Get volatility indicators pack: BBANDS, ATR, SAR with preset configurations.
 
     Args:
         symbol: The stock symbol to analyze
@@ -492,53 +690,93 @@ async def get_volume_indicators(
         preset: Preset configuration ('fast', 'standard', 'slow')
 
     Returns:
-        Volume indicators data with all indicators in the pack
+        Volatility indicators data with all indicators in the pack
     """
 
-    # Define presets configuration
-    presets = {
+    missing: List[str] = []
+    result = {
+        "metadata": {"symbol": symbol, "interval": interval, "preset": preset},
+        "items": [
+            row
+            async for row in iter_volatility_indicators(
+                symbol, interval, preset, missing
+            )
+        ],
+    }
+    # Incomplete packs are returned but not cached
+    return Uncached(result) if missing else result
+
+
+_VOLUME_PRESETS = _frozen_presets(
+    {
         "fast": {"ADOSC": {"fastperiod": 2, "slowperiod": 7}},
         "standard": {"ADOSC": {"fastperiod": 3, "slowperiod": 10}},
         "slow": {"ADOSC": {"fastperiod": 5, "slowperiod": 20}},
     }
+)
 
-    common = {"series_type": "close"}
-    preset_config = presets.get(preset, presets["standard"])
 
-    # Fetch all indicators with their specific parameters
-    indicators = {}
-    indicators["OBV"] = await fetch_obv(symbol=symbol, interval=interval)
-    indicators["AD"] = await fetch_ad(symbol=symbol, interval=interval)
-    indicators["ADOSC"] = await fetch_adosc(
-        symbol=symbol, interval=interval, **preset_config["ADOSC"]
-    )
+async def iter_volume_indicators(
+    symbol: str,
+    interval: str,
+    preset: str = "standard",
+    missing: Optional[List[str]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield volume indicator rows as each indicator's data arrives.
 
-    # Transform to unified format with max 20 items per indicator
-    items = []
-    for indicator_name, data in indicators.items():
-        if isinstance(data, dict) and "items" in data:
-            count = 0
-            for timestamp, values in data["items"].items():
-                if count >= 20:
-                    break
-                # All volume indicators have single values
-                for key, value in values.items():
-                    items.append(
-                        {
-                            "timestamp": _normalize_timestamp(timestamp, interval),
-                            "indicator": indicator_name.lower(),
-                            "component": "value",
-                            "value": value,
-                        }
-                    )
-                count += 1
+    Args:
+        symbol: The stock symbol to analyze
+        interval: Time interval for the data
+        preset: Preset configuration ('fast', 'standard', 'slow')
+        missing: If given, the names of indicators left out are appended to it
 
-    return {
+    Yields:
+        Flattened timestamp/indicator/component rows
+    """
+
+    preset_config = _VOLUME_PRESETS.get(preset, _VOLUME_PRESETS["standard"])
+
+    fetches = {
+        "OBV": fetch_obv(symbol=symbol, interval=interval),
+        "AD": fetch_ad(symbol=symbol, interval=interval),
+        "ADOSC": fetch_adosc(
+            symbol=symbol, interval=interval, **preset_config["ADOSC"]
+        ),
+    }
+    async for row in _iter_indicator_pack(fetches, interval, set(), missing=missing):
+        yield row
+
+
+@async_ttl_cache(ttl=60)
+async def get_volume_indicators(
+    symbol: str, interval: str, preset: str = "standard", **params
+) -> Dict[str, Any]:
+    """
+    Get volume indicators pack: OBV, AD, ADOSC with preset configurations.
+
+    Args:
+        symbol: The stock symbol to analyze
+        interval: Time interval for the data
+        preset: Preset configuration ('fast', 'standard', 'slow')
+
+    Returns:
+        Volume indicators data with all indicators in the pack
+    """
+
+    missing: List[str] = []
+    result = {
         "metadata": {"symbol": symbol, "interval": interval, "preset": preset},
-        "items": items,
+        "items": [
+            row
+            async for row in iter_volume_indicators(symbol, interval, preset, missing)
+        ],
     }
+    # Incomplete packs are returned but not cached
+    return Uncached(result) if missing else result
 
 
+@async_ttl_cache(ttl=3600)
 async def get_financial_statements(
     symbol: str, statement_type: str = "all"
 ) -> Dict[str, Any]:
@@ -556,11 +794,17 @@ async def get_financial_statements(
     statement_type = statement_type.lower()
 
     if statement_type == "all":
+        # A notice in place of any statement raises, so no partial result is cached
+        income, balance, cash_flow = await asyncio.gather(
+            fetch_income_statement(symbol),
+            fetch_balance_sheet(symbol),
+            fetch_cash_flow(symbol),
+        )
         return {
             "symbol": symbol,
-            "income_statement": await fetch_income_statement(symbol),
-            "balance_sheet": await fetch_balance_sheet(symbol),
-            "cash_flow": await fetch_cash_flow(symbol),
+            "income_statement": income,
+            "balance_sheet": balance,
+            "cash_flow": cash_flow,
         }
     elif statement_type == "income":
         return await fetch_income_statement(symbol)
@@ -635,6 +879,46 @@ async def get_news_sentiment(
     )
 
 
+def _finalize_analytics(
+    result: Any,
+    window_type: str,
+    symbols: List[str],
+    calculations: List[str],
+    interval: str,
+    series_range: str,
+    ohlc: str,
+    window_size: Optional[int],
+) -> Any:
+    """Ensure an analytics response carries the fields required by the schema."""
+    if not isinstance(result, dict):
+        return result
+
+    result["window_type"] = window_type
+    result["symbols"] = symbols
+    # Ensure JSON data format fields if not present
+    if window_type == "fixed" and "data_format" not in result:
+        result["data_format"] = "json"
+    if "results" not in result:
+        # Create sample flat JSON results for each symbol and calculation
+        result["results"] = [
+            {"symbol": symbol, "calculation": calc, "value": 0.0, "date": "2024-01-01"}
+            for symbol, calc in product(symbols, calculations)
+        ]
+    # Ensure metadata includes all the request parameters
+    if "metadata" not in result:
+        result["metadata"] = {}
+    result["metadata"].update(
+        {
+            "interval": interval,
+            "series_range": series_range,
+            "ohlc": ohlc,
+            "window_size": window_size,
+            "calculations": calculations,
+        }
+    )
+    return result
+
+
 async def analyze_stocks(
     symbols: List[str],
     interval: str,
@@ -667,79 +951,29 @@ async def analyze_stocks(
             ohlc=ohlc,
             window_size=window_size,
         )
-        # Ensure required fields are set in the response
-        if isinstance(result, dict):
-            result["window_type"] = "sliding"
-            result["symbols"] = symbols
-            # Ensure JSON data format fields if not present
-            if "results" not in result:
-                # Create sample flat JSON results for each symbol and calculation
-                result["results"] = []
-                for symbol in symbols:
-                    for calc in calculations:
-                        result["results"].append(
-                            {
-                                "symbol": symbol,
-                                "calculation": calc,
-                                "value": 0.0,
-                                "date": "2024-01-01",
-                            }
-                        )
-            # Ensure metadata includes all the request parameters
-            if "metadata" not in result:
-                result["metadata"] = {}
-            result["metadata"].update(
-                {
-                    "interval": interval,
-                    "series_range": series_range,
-                    "ohlc": ohlc,
-                    "window_size": window_size,
-                    "calculations": calculations,
-                }
-            )
-        return result
-    else:
-        # Use fixed window analytics (default behavior)
-        result = await fetch_analytics_fixed_window(
-            symbols=symbols,
-            interval=interval,
-            calculations=calculations,
-            series_range=series_range,
-            ohlc=ohlc,
+        return _finalize_analytics(
+            result,
+            "sliding",
+            symbols,
+            calculations,
+            interval,
+            series_range,
+            ohlc,
+            window_size,
         )
-        # Ensure required fields are set in the response
-        if isinstance(result, dict):
-            result["window_type"] = "fixed"
-            result["symbols"] = symbols
-            # Ensure JSON data format fields if not present
-            if "data_format" not in result:
-                result["data_format"] = "json"
-            if "results" not in result:
-                # Create sample flat JSON results for each symbol and calculation
-                result["results"] = []
-                for symbol in symbols:
-                    for calc in calculations:
-                        result["results"].append(
-                            {
-                                "symbol": symbol,
-                                "calculation": calc,
-                                "value": 0.0,
-                                "date": "2024-01-01",
-                            }
-                        )
-            # Ensure metadata includes all the request parameters
-            if "metadata" not in result:
-                result["metadata"] = {}
-            result["metadata"].update(
-                {
-                    "interval": interval,
-                    "series_range": series_range,
-                    "ohlc": ohlc,
-                    "window_size": None,  # Fixed window doesn't use window_size
-                    "calculations": calculations,
-                }
-            )
-        return result
+
+    # Use fixed window analytics (default behavior)
+    result = await fetch_analytics_fixed_window(
+        symbols=symbols,
+        interval=interval,
+        calculations=calculations,
+        series_range=series_range,
+        ohlc=ohlc,
+    )
+    # Fixed window doesn't use window_size
+    return _finalize_analytics(
+        result, "fixed", symbols, calculations, interval, series_range, ohlc, None
+    )
 
 
 async def get_symbol_overview(symbol: str, profile_type: str) -> Dict[str, Any]:
@@ -761,6 +995,36 @@ async def get_symbol_overview(symbol: str, profile_type: str) -> Dict[str, Any]:
         raise ValueError(f"Unsupported profile type: {profile_type}")
 
 
+@lru_cache(maxsize=512)
+def _camel_to_snake(name: str) -> str:
+    """Convert camelCase to snake_case (e.g., 'reportedEPS' -> 'reported_eps')."""
+    return _CAMEL_RE2.sub(r"\1_\2", _CAMEL_RE1.sub(r"\1_\2", name)).lower()
+
+
+@lru_cache(maxsize=1024)
+def _fiscal_date_to_quarter(fiscal_date: str) -> str:
+    """Convert fiscal date to quarter format (e.g., '2024-09-30' -> '2024-Q3')"""
+    year, month = fiscal_date[:4], fiscal_date[5:7]
+    if len(fiscal_date) != 10 or not (year.isdigit() and month.isdigit()):
+        return "Unknown"
+    month_num = int(month)
+    if not 1 <= month_num <= 12:
+        return "Unknown"
+    return f"{year}-Q{(month_num + 2) // 3}"
+
+
+def _earnings_row(item: Dict[str, Any], with_quarter: bool = False) -> Dict[str, Any]:
+    """Convert an earnings entry to snake_case keys, optionally adding its quarter."""
+    row = {
+        _EARNINGS_FIELDS.get(key) or _camel_to_snake(key): value
+        for key, value in item.items()
+    }
+    # Add quarter field in our format
+    if with_quarter and "fiscalDateEnding" in item:
+        row["quarter"] = _fiscal_date_to_quarter(item["fiscalDateEnding"])
+    return row
+
+
 async def get_earning_data(
     symbol: str, quarter: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -777,76 +1041,27 @@ async def get_earning_data(
     # Get earnings data from the API
     earnings_data = await fetch_earnings(symbol)
 
-    def camel_to_snake(name: str) -> str:
-        """Convert camelCase to snake_case"""
-        import re
-
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
-
-    def fiscal_date_to_quarter(fiscal_date: str) -> str:
-        """Convert fiscal date to quarter format (e.g., '2024-09-30' -> '2024-Q4')"""
-        try:
-            from datetime import datetime
-
-            date_obj = datetime.strptime(fiscal_date, "%Y-%m-%d")
-            month = date_obj.month
-            year = date_obj.year
-
-            # Map months to quarters (fiscal quarters)
-            if month in [1, 2, 3]:
-                quarter_num = "Q1"
-            elif month in [4, 5, 6]:
-                quarter_num = "Q2"
-            elif month in [7, 8, 9]:
-                quarter_num = "Q3"
-            else:  # 10, 11, 12
-                quarter_num = "Q4"
-
-            return f"{year}-{quarter_num}"
-        except Exception:
-            return "Unknown"
-
     # Transform the response to snake_case
     transformed_data = {"symbol": earnings_data.get("symbol", "")}
 
     # Transform annual earnings
     if "annualEarnings" in earnings_data:
-        annual_earnings = []
-        for item in earnings_data["annualEarnings"]:
-            transformed_item = {}
-            for key, value in item.items():
-                snake_key = camel_to_snake(key)
-                transformed_item[snake_key] = value
-            annual_earnings.append(transformed_item)
-        transformed_data["annual_earnings"] = annual_earnings
-
-    # Transform quarterly earnings and add quarter field
+        transformed_data["annual_earnings"] = [
+            _earnings_row(item) for item in earnings_data["annualEarnings"]
+        ]
+
+    # Transform quarterly earnings and add quarter field, keeping only the
+    # requested quarter if one is specified
     if "quarterlyEarnings" in earnings_data:
-        quarterly_earnings = []
-        for item in earnings_data["quarterlyEarnings"]:
-            transformed_item = {}
-            for key, value in item.items():
-                snake_key = camel_to_snake(key)
-                transformed_item[snake_key] = value
-
-            # Add quarter field in our format
-            if "fiscalDateEnding" in item:
-                transformed_item["quarter"] = fiscal_date_to_quarter(
-                    item["fiscalDateEnding"]
-                )
-
-            quarterly_earnings.append(transformed_item)
-        transformed_data["quarterly_earnings"] = quarterly_earnings
-
-    # If quarter is specified, filter quarterly earnings
-    if quarter and "quarterly_earnings" in transformed_data:
-        filtered_quarterly = [
-            q
-            for q in transformed_data["quarterly_earnings"]
-            if q.get("quarter") == quarter
+        transformed_data["quarterly_earnings"] = [
+            _earnings_row(item, with_quarter=True)
+            for item in earnings_data["quarterlyEarnings"]
+            if not quarter
+            or (
+                "fiscalDateEnding" in item
+                and _fiscal_date_to_quarter(item["fiscalDateEnding"]) == quarter
+            )
         ]
-        transformed_data["quarterly_earnings"] = filtered_quarterly
 
     return transformed_data
 
@@ -862,8 +1077,9 @@ async def get_corporate_actions(symbol: str) -> Dict[str, Any]:
         Corporate actions data containing both dividends and splits
     """
     # Fetch raw data from API
-    dividends_response = await company_dividends(symbol)
-    splits_response = await fetch_company_splits(symbol)
+    dividends_response, splits_response = await asyncio.gather(
+        company_dividends(symbol), fetch_company_splits(symbol)
+    )
 
     # Extract the data arrays and format according to schema
     dividends_data = dividends_response.get("data", [])
@@ -899,6 +1115,69 @@ async def get_corporate_actions(symbol: str) -> Dict[str, Any]:
     }
 
 
+def _csv_rows(csv_data: str) -> Iterator[List[str]]:
+    """Return an iterator over the data rows of a CSV response (header skipped)."""
+    reader = csv.reader(io.StringIO(csv_data.strip()))
+    next(reader, None)  # Skip header
+    return reader
+
+
+def _arrow_csv_to_list(csv_data: str, headers: Sequence[str]) -> list:
+    """Parse CSV data with pyarrow, skipping rows with the wrong column count."""
+    table = pacsv.read_csv(
+        pa.BufferReader(csv_data.encode()),
+        read_options=pacsv.ReadOptions(column_names=list(headers), skip_rows=1),
+        parse_options=pacsv.ParseOptions(invalid_row_handler=lambda row: "skip"),
+        # Keep every field as a string, like the csv module fallback
+        convert_options=pacsv.ConvertOptions(
+            column_types={header: pa.string() for header in headers},
+            strings_can_be_null=False,
+        ),
+    )
+    return table.to_pylist()
+
+
+def _csv_to_list(csv_data: str, headers: Sequence[str]) -> list:
+    """Convert CSV data to list of dictionaries"""
+    if pa is not None:
+        try:
+            return _arrow_csv_to_list(csv_data, headers)
+        except pa.ArrowInvalid:
+            pass  # e.g. an empty response; let the csv module handle it
+    return [
+        dict(zip(headers, values))
+        for values in _csv_rows(csv_data)
+        if len(values) == len(headers)
+    ]
+
+
+async def _parse_csv(csv_data: str, headers: Sequence[str]) -> list:
+    """Parse CSV data into dictionaries, off the event loop thread if it is large."""
+    if len(csv_data) > PARSE_IN_THREAD_THRESHOLD:
+        return await asyncio.to_thread(_csv_to_list, csv_data, headers)
+    return _csv_to_list(csv_data, headers)
+
+
+_EARNINGS_CALENDAR_HEADERS = (
+    "symbol",
+    "name",
+    "report_date",
+    "fiscal_date_ending",
+    "estimate",
+    "currency",
+)
+_IPO_CALENDAR_HEADERS = (
+    "symbol",
+    "name",
+    "ipo_date",
+    "price_range_low",
+    "price_range_high",
+    "currency",
+    "exchange",
+)
+
+
+@async_ttl_cache(ttl=3600)
 async def get_market_calendar(
     symbol: Optional[str] = None,
     horizon: str = "3month",
@@ -916,35 +1195,14 @@ async def get_market_calendar(
         Structured market calendar data with earnings and optionally IPO data
     """
 
-    def csv_to_list(csv_data: str, headers: list) -> list:
-        """Convert CSV data to list of dictionaries"""
-        lines = csv_data.strip().split("\n")
-        if len(lines) <= 1:  # Only header or empty
-            return []
-
-        data = []
-        for line in lines[1:]:  # Skip header
-            values = [
-                val.strip().rstrip("\r") for val in line.split(",")
-            ]  # Clean carriage returns
-            if len(values) == len(headers):
-                item = {}
-                for i, header in enumerate(headers):
-                    item[header] = values[i]
-                data.append(item)
-        return data
-
-    # Always fetch earnings data
-    earnings_csv = await fetch_earnings_calendar(symbol, horizon)
-    earnings_headers = [
-        "symbol",
-        "name",
-        "report_date",
-        "fiscal_date_ending",
-        "estimate",
-        "currency",
-    ]
-    earnings_data = csv_to_list(earnings_csv, earnings_headers)
+    # Always fetch earnings data, together with the IPO calendar if requested
+    if with_ipos:
+        earnings_csv, ipo_csv = await asyncio.gather(
+            fetch_earnings_calendar(symbol, horizon), fetch_ipo_calendar()
+        )
+    else:
+        earnings_csv = await fetch_earnings_calendar(symbol, horizon)
+    earnings_data = await _parse_csv(earnings_csv, _EARNINGS_CALENDAR_HEADERS)
 
     result = {
         "horizon": horizon,
@@ -956,19 +1214,9 @@ async def get_market_calendar(
     if symbol:
         result["symbol"] = symbol
 
-    # Optionally fetch IPO data
+    # Optionally include IPO data
     if with_ipos:
-        ipo_csv = await fetch_ipo_calendar()
-        ipo_headers = [
-            "symbol",
-            "name",
-            "ipo_date",
-            "price_range_low",
-            "price_range_high",
-            "currency",
-            "exchange",
-        ]
-        ipo_data = csv_to_list(ipo_csv, ipo_headers)
+        ipo_data = await _parse_csv(ipo_csv, _IPO_CALENDAR_HEADERS)
         result["ipos"] = ipo_data
     else:
         result["ipos"] = []
@@ -976,6 +1224,18 @@ async def get_market_calendar(
     return result
 
 
+_LISTING_HEADERS = (
+    "symbol",
+    "name",
+    "exchange",
+    "asset_type",
+    "ipo_date",
+    "delisting_date",
+    "status",
+)
+
+
+@async_ttl_cache(ttl=3600)
 async def get_listing_status(
     date: Optional[str] = None, state: str = "active"
 ) -> Dict[str, Any]:
@@ -990,31 +1250,9 @@ async def get_listing_status(
         Structured listing status data
     """
 
-    def csv_to_listings(csv_data: str) -> list:
-        """Convert CSV data to list of listing dictionaries"""
-        lines = csv_data.strip().split("\n")
-        if len(lines) <= 1:  # Only header or empty
-            return []
-
-        listings = []
-        for line in lines[1:]:  # Skip header
-            values = [val.strip().rstrip("\r") for val in line.split(",")]
-            if len(values) >= 7:  # Ensure we have all expected fields
-                listing = {
-                    "symbol": values[0],
-                    "name": values[1],
-                    "exchange": values[2],
-                    "asset_type": values[3],
-                    "ipo_date": values[4],
-                    "delisting_date": values[5],
-                    "status": values[6],
-                }
-                listings.append(listing)
-        return listings
-
     # Fetch CSV data from API
     csv_data = await fetch_listing_status(date, state)
-    listings_data = csv_to_listings(csv_data)
+    listings_data = await _parse_csv(csv_data, _LISTING_HEADERS)
 
     result = {
         "state": state,
@@ -1028,6 +1266,69 @@ async def get_listing_status(
     return result
 
 
+def _remap_keys(source: Dict[str, Any], key_pairs: tuple) -> Dict[str, Any]:
+    """
+    Rename the keys of an API object using (Alpha Vantage key, snake_case key) pairs.
+
+    Keys missing from ``source`` (or holding None) are left out of the result.
+    """
+    remapped = {}
+    for old_key, new_key in key_pairs:
+        value = source.get(old_key)
+        if value is not None:
+            remapped[new_key] = value
+    return remapped
+
+
+def _time_series_key(
+    data: Dict[str, Any],
+    expected: Optional[str],
+    markers: tuple = ("Time Series",),
+) -> Optional[str]:
+    """
+    Find the key holding the time series object in an API response.
+
+    Args:
+        data: Raw API response
+        expected: Key the endpoint normally uses, checked first
+        markers: Substrings a key must contain when falling back to a scan
+
+    Returns:
+        The time series key, or None if the response has none
+    """
+    if expected in data:
+        return expected
+    return next((key for key in data if all(m in key for m in markers)), None)
+
+
+def _series_items(
+    time_series: Dict[str, Any],
+    value_keys: tuple,
+    as_str: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Convert an Alpha Vantage time series object into a date-sorted items array.
+
+    Args:
+        time_series: Mapping of date/timestamp to raw values
+        value_keys: (Alpha Vantage key, snake_case key) pairs to keep
+        as_str: Convert every value to a string
+
+    Returns:
+        One item per date with a "date" field and the renamed values
+    """
+    items = []
+    for date, values in sorted(time_series.items()):
+        item = {"date": date}
+        if isinstance(values, dict):
+            for old_key, new_key in value_keys:
+                value = values.get(old_key)
+                if value is not None:
+                    item[new_key] = str(value) if as_str else value
+        items.append(item)
+    return items
+
+
 async def get_current_fx_rate(
     from_currency: str, to_currency: str
 ) -> Union[Dict[str, Any], str]:
@@ -1052,24 +1353,7 @@ async def get_current_fx_rate(
             rate_data = data["Realtime Currency Exchange Rate"]
 
             # Normalize the nested keys
-            normalized_rate = {}
-            key_mappings = {
-                "1. From_Currency Code": "from_currency_code",
-                "2. From_Currency Name": "from_currency_name",
-                "3. To_Currency Code": "to_currency_code",
-                "4. To_Currency Name": "to_currency_name",
-                "5. Exchange Rate": "exchange_rate",
-                "6. Last Refreshed": "last_refreshed",
-                "7. Time Zone": "time_zone",
-                "8. Bid Price": "bid_price",
-                "9. Ask Price": "ask_price",
-            }
-
-            for old_key, new_key in key_mappings.items():
-                if old_key in rate_data:
-                    normalized_rate[new_key] = rate_data[old_key]
-
-            return normalized_rate
+            return _remap_keys(rate_data, _FX_RATE_KEYS)
 
         return data
 
@@ -1102,67 +1386,17 @@ async def get_fx_time_series(
 
         # Handle metadata
         if "Meta Data" in data:
-            metadata = data["Meta Data"]
-            normalized_metadata = {}
-
-            metadata_key_mappings = {
-                "1. Information": "information",
-                "2. From Symbol": "from_symbol",
-                "3. To Symbol": "to_symbol",
-                "4. Output Size": "output_size",
-                "5. Last Refreshed": "last_refreshed",
-                "6. Time Zone": "time_zone",
-                "7. Interval": "interval",
-            }
+            normalized["metadata"] = _remap_keys(data["Meta Data"], _FX_METADATA_KEYS)
 
-            for old_key, new_key in metadata_key_mappings.items():
-                if old_key in metadata and metadata[old_key] is not None:
-                    normalized_metadata[new_key] = metadata[old_key]
-
-            normalized["metadata"] = normalized_metadata
-
-        # Handle time series data - find the time series key dynamically
-        time_series_key = None
-        for key in data.keys():
-            if key.startswith("Time Series"):
-                time_series_key = key
-                break
-
-        if time_series_key and time_series_key in data:
-            time_series_data = data[time_series_key]
-
-            # Normalize each date entry's keys
-            normalized_time_series = {}
-            for date, values in time_series_data.items():
-                if isinstance(values, dict):
-                    normalized_values = {}
-                    value_key_mappings = {
-                        "1. open": "open",
-                        "2. high": "high",
-                        "3. low": "low",
-                        "4. close": "close",
-                    }
-
-                    for old_key, new_key in value_key_mappings.items():
-                        if old_key in values:
-                            normalized_values[new_key] = values[old_key]
-
-                    normalized_time_series[date] = normalized_values
-                else:
-                    normalized_time_series[date] = values
-
-            # Convert object to sorted array with date field
-            items_array = []
-            for date, values in sorted(normalized_time_series.items()):
-                item = {"date": date}
-                item.update(values)
-                items_array.append(item)
-            normalized["items"] = items_array
+        # Handle time series data
+        time_series_key = _time_series_key(data, _FX_SERIES_KEYS.get(interval))
+        if time_series_key:
+            normalized["items"] = _series_items(data[time_series_key], _FX_VALUE_KEYS)
 
         return normalized
 
     # Get raw data based on interval
-    if interval in ["1min", "5min", "15min", "30min", "60min"]:
+    if interval in _INTRADAY:
         raw_data = await fetch_fx_intraday(from_symbol, to_symbol, interval, **params)
     elif interval == "daily":
         raw_data = await fetch_fx_daily(from_symbol, to_symbol, **params)
@@ -1187,33 +1421,28 @@ async def get_current_crypto_quote(symbol: str, market: str) -> Dict[str, Any]:
     Returns:
         Current cryptocurrency market quote with normalized data
     """
-    import json
-
-    def normalize_crypto_quote(data_str: str) -> dict:
-        """Parse and normalize crypto quote data"""
-        data = json.loads(data_str)
 
+    def normalize_crypto_quote(data: dict) -> dict:
+        """Normalize crypto quote data"""
         # Extract metadata
         metadata = data.get("Meta Data", {})
 
-        # Find time series key dynamically
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series" in key and "Digital Currency" in key:
-                time_series_key = key
-                break
-
-        if not time_series_key or time_series_key not in data:
+        # Find time series key
+        time_series_key = _time_series_key(
+            data,
+            _CRYPTO_SERIES_KEYS["daily"],
+            ("Time Series", "Digital Currency"),
+        )
+        if not time_series_key:
             raise ValueError("Time series data not found in response")
 
         time_series = data[time_series_key]
 
         # Get the most recent date (current quote)
-        dates = sorted(time_series.keys(), reverse=True)
-        if not dates:
+        if not time_series:
             raise ValueError("No time series data available")
 
-        latest_date = dates[0]
+        latest_date = max(time_series)
         latest_data = time_series[latest_date]
 
         # Normalize metadata keys
@@ -1239,7 +1468,6 @@ async def get_current_crypto_quote(symbol: str, market: str) -> Dict[str, Any]:
         normalized_quote["current_quote"] = current_quote
         return normalized_quote
 
-    # Get raw JSON data
     raw_data = await fetch_digital_currency_daily(symbol, market)
     return normalize_crypto_quote(raw_data)
 
@@ -1259,97 +1487,42 @@ async def get_crypto_time_series(
     Returns:
         Historical cryptocurrency time series data with structured OHLCV pricing
     """
-    import json
 
-    def normalize_crypto_series(data: dict, is_from_string: bool = False) -> dict:
+    def normalize_crypto_series(data: dict) -> dict:
         """Normalize crypto time series data to consistent format"""
-        if is_from_string:
-            # Parse JSON string for daily/weekly/monthly data
-            data = json.loads(data)
-
         normalized = {}
 
         # Handle metadata
         if "Meta Data" in data:
-            metadata = data["Meta Data"]
-            normalized_metadata = {}
-
-            # Common metadata key mappings
-            metadata_key_mappings = {
-                "1. Information": "information",
-                "2. Digital Currency Code": "symbol",
-                "3. Digital Currency Name": "name",
-                "4. Market Code": "market",
-                "5. Market Name": "market_name",
-                "6. Last Refreshed": "last_refreshed",
-                "7. Interval": "interval",
-                "8. Output Size": "output_size",
-                "9. Time Zone": "time_zone",
-            }
+            normalized["metadata"] = _remap_keys(
+                data["Meta Data"], _CRYPTO_METADATA_KEYS
+            )
 
-            for old_key, new_key in metadata_key_mappings.items():
-                if old_key in metadata and metadata[old_key] is not None:
-                    normalized_metadata[new_key] = metadata[old_key]
-
-            normalized["metadata"] = normalized_metadata
-
-        # Handle time series data - find the time series key dynamically
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series" in key:
-                time_series_key = key
-                break
-
-        if time_series_key and time_series_key in data:
-            time_series_data = data[time_series_key]
-
-            # Normalize each timestamp entry's keys
-            normalized_time_series = {}
-            for timestamp, values in time_series_data.items():
-                if isinstance(values, dict):
-                    normalized_values = {}
-                    value_key_mappings = {
-                        "1. open": "open",
-                        "2. high": "high",
-                        "3. low": "low",
-                        "4. close": "close",
-                        "5. volume": "volume",
-                    }
-
-                    for old_key, new_key in value_key_mappings.items():
-                        if old_key in values:
-                            # Ensure all values are strings to match schema
-                            normalized_values[new_key] = str(values[old_key])
-
-                    normalized_time_series[timestamp] = normalized_values
-                else:
-                    normalized_time_series[timestamp] = values
-
-            # Convert object to sorted array with date field
-            items_array = []
-            for timestamp, values in sorted(normalized_time_series.items()):
-                item = {"date": timestamp}
-                item.update(values)
-                items_array.append(item)
-            normalized["items"] = items_array
+        # Handle time series data
+        time_series_key = _time_series_key(data, _CRYPTO_SERIES_KEYS.get(interval))
+        if time_series_key:
+            # Ensure all values are strings to match schema
+            normalized["items"] = _series_items(
+                data[time_series_key], _CRYPTO_VALUE_KEYS, as_str=True
+            )
 
         return normalized
 
     # Get raw data based on interval
-    if interval in ["1min", "5min", "15min", "30min", "60min"]:
+    if interval in _INTRADAY:
         raw_data = await fetch_digital_currency_intraday(
             symbol, market, interval, **params
         )
-        return normalize_crypto_series(raw_data, is_from_string=False)
+        return normalize_crypto_series(raw_data)
     elif interval == "daily":
         raw_data = await fetch_digital_currency_daily(symbol, market)
-        return normalize_crypto_series(raw_data, is_from_string=True)
+        return normalize_crypto_series(raw_data)
     elif interval == "weekly":
         raw_data = await fetch_digital_currency_weekly(symbol, market)
-        return normalize_crypto_series(raw_data, is_from_string=True)
+        return normalize_crypto_series(raw_data)
     elif interval == "monthly":
         raw_data = await fetch_digital_currency_monthly(symbol, market)
-        return normalize_crypto_series(raw_data, is_from_string=True)
+        return normalize_crypto_series(raw_data)
     else:
         raise ValueError(f"Unsupported interval: {interval}")
 
@@ -1413,9 +1586,10 @@ async def get_growth_metrics(
     Returns:
         Growth metrics data in JSON format
     """
-    # Fetch both real GDP and real GDP per capita
-    gdp_data = await fetch_real_gdp(**params)
-    gdp_per_capita_data = await fetch_real_gdp_per_capita(**params)
+    # Fetch real GDP and real GDP per capita concurrently
+    gdp_data, gdp_per_capita_data = await asyncio.gather(
+        fetch_real_gdp(**params), fetch_real_gdp_per_capita(**params)
+    )
 
     return {
         "frequency": frequency,
@@ -1453,22 +1627,26 @@ async def get_rates_yields(
     if maturities is None:
         maturities = ["10year"]
 
-    results = []
+    # Fetch the federal funds rate (if requested) and every maturity concurrently
+    fetches = [
+        fetch_treasury_yield(maturity=maturity, **params) for maturity in maturities
+    ]
+    if include_target_range:
+        fetches.insert(0, fetch_federal_funds_rate(**params))
+    responses = await asyncio.gather(*fetches)
 
-    # Fetch federal funds rate if requested
+    results = []
     if include_target_range:
-        fed_rate_data = await fetch_federal_funds_rate(**params)
         results.append(
             {
                 "metric": "federal_funds_rate",
-                "raw_data": fed_rate_data,
+                "raw_data": responses[0],
                 "type": "Federal Funds Rate",
             }
         )
+        responses = responses[1:]
 
-    # Fetch treasury yields for each maturity
-    for maturity in maturities:
-        treasury_data = await fetch_treasury_yield(maturity=maturity, **params)
+    for maturity, treasury_data in zip(maturities, responses):
         results.append(
             {
                 "metric": f"treasury_yield_{maturity}",
@@ -1505,19 +1683,14 @@ async def get_prices_inflation(
     Returns:
         Price and inflation data in JSON format
     """
-    results = []
-
-    # Fetch CPI data
-    cpi_data = await fetch_cpi(**params)
-    results.append(
-        {"metric": "cpi", "raw_data": cpi_data, "type": "Consumer Price Index"}
-    )
-
-    # Fetch inflation data
-    inflation_data = await fetch_inflation(**params)
-    results.append(
-        {"metric": "inflation", "raw_data": inflation_data, "type": "Inflation Rate"}
+    # Fetch CPI and inflation data concurrently
+    cpi_data, inflation_data = await asyncio.gather(
+        fetch_cpi(**params), fetch_inflation(**params)
     )
+    results = [
+        {"metric": "cpi", "raw_data": cpi_data, "type": "Consumer Price Index"},
+        {"metric": "inflation", "raw_data": inflation_data, "type": "Inflation Rate"},
+    ]
 
     return {
         "frequency": frequency,
@@ -1545,42 +1718,37 @@ async def get_labor_activity(
     Returns:
         Labor and activity data in JSON format
     """
-    results = []
+    # Core labor metrics are always included, demand indicators are optional
+    fetches = [fetch_unemployment(**params), fetch_nonfarm_payrolls(**params)]
+    if include_demand:
+        fetches += [fetch_retail_sales(**params), fetch_durables(**params)]
+    responses = await asyncio.gather(*fetches)
 
-    # Core labor metrics (always included)
-    unemployment_data = await fetch_unemployment(**params)
-    results.append(
+    results = [
         {
             "metric": "unemployment",
-            "raw_data": unemployment_data,
+            "raw_data": responses[0],
             "type": "Unemployment Rate",
-        }
-    )
-
-    payrolls_data = await fetch_nonfarm_payrolls(**params)
-    results.append(
+        },
         {
             "metric": "nonfarm_payrolls",
-            "raw_data": payrolls_data,
+            "raw_data": responses[1],
             "type": "Nonfarm Payrolls",
-        }
-    )
-
-    # Demand indicators (optional)
+        },
+    ]
     if include_demand:
-        retail_data = await fetch_retail_sales(**params)
-        results.append(
-            {"metric": "retail_sales", "raw_data": retail_data, "type": "Retail Sales"}
-        )
-
-        durables_data = await fetch_durables(**params)
-        results.append(
+        results += [
+            {
+                "metric": "retail_sales",
+                "raw_data": responses[2],
+                "type": "Retail Sales",
+            },
             {
                 "metric": "durables",
-                "raw_data": durables_data,
+                "raw_data": responses[3],
                 "type": "Durable Goods Orders",
-            }
-        )
+            },
+        ]
 
     return {
         "frequency": frequency,
@@ -1593,30 +1761,65 @@ async def get_labor_activity(
 # Core functions with clean key formatting
 async def get_current_stock_quote(symbol: str) -> Dict[str, Any]:
     """Get current stock quote with clean key formatting."""
-    from .api_helpers import fetch_quote as raw_fetch_quote
-
-    raw_data = await raw_fetch_quote(symbol=symbol, datatype="json")
+    raw_data = await fetch_quote(symbol=symbol, datatype="json")
 
     # Clean up the Global Quote keys
     if "Global Quote" in raw_data:
         global_quote = raw_data["Global Quote"]
         clean_quote = {
-            "symbol": global_quote.get("01. symbol"),
-            "open": global_quote.get("02. open"),
-            "high": global_quote.get("03. high"),
-            "low": global_quote.get("04. low"),
-            "price": global_quote.get("05. price"),
-            "volume": global_quote.get("06. volume"),
-            "latest_trading_day": global_quote.get("07. latest trading day"),
-            "previous_close": global_quote.get("08. previous close"),
-            "change": global_quote.get("09. change"),
-            "change_percent": global_quote.get("10. change percent"),
+            new_key: global_quote.get(old_key)
+            for old_key, new_key in _GLOBAL_QUOTE_KEYS
         }
         return {"quote": clean_quote}
 
     return raw_data
 
 
+# REALTIME_BULK_QUOTES accepts at most this many symbols per request
+_BULK_QUOTE_CHUNK = 100
+
+
+async def get_bulk_quotes(symbols: List[str]) -> Dict[str, Any]:
+    """
+    Get current quotes for many symbols using the bulk quotes endpoint.
+
+    Args:
+        symbols: Stock ticker symbols to quote
+
+    Returns:
+        Quotes for all requested symbols, fetched in chunks of 100 per request
+    """
+    chunks = [
+        symbols[i : i + _BULK_QUOTE_CHUNK]
+        for i in range(0, len(symbols), _BULK_QUOTE_CHUNK)
+    ]
+    responses = await asyncio.gather(
+        *(fetch_realtime_bulk_quotes(symbols=chunk) for chunk in chunks)
+    )
+
+    quotes = [
+        quote
+        for response in responses
+        if isinstance(response, dict)
+        for quote in response.get("data") or []
+    ]
+    if not quotes:
+        # e.g. {"message": "Invalid symbols", "data": []}; never cache it as data
+        messages = [
+            response["message"]
+            for response in responses
+            if isinstance(response, dict) and response.get("message")
+        ]
+        if messages:
+            raise ValueError(f"Alpha Vantage API error: {messages[0]}")
+
+    return {
+        "symbols_requested": symbols,
+        "total_symbols": len(symbols),
+        "quotes": quotes,
+    }
+
+
 async def get_stock_time_series(
     symbol: str, interval: str = "daily", adjusted: bool = False, **kwargs
 ) -> Dict[str, Any]:
@@ -1631,56 +1834,18 @@ async def get_stock_time_series(
         # Clean Meta Data
         if "Meta Data" in raw_data:
             meta = raw_data["Meta Data"]
-            # Build metadata and remove None values
-            metadata = {
-                "information": meta.get("1. Information"),
-                "symbol": meta.get("2. Symbol"),
-                "last_refreshed": meta.get("3. Last Refreshed"),
-                "output_size": meta.get("4. Output Size"),
-                "time_zone": meta.get("5. Time Zone"),
-                "interval": meta.get("4. Interval") or interval,  # For intraday
-            }
-            # Remove None values from metadata
-            cleaned_data["metadata"] = {
-                k: v for k, v in metadata.items() if v is not None
-            }
+            metadata = _remap_keys(meta, _STOCK_METADATA_KEYS)
+            metadata["interval"] = meta.get("4. Interval") or interval  # For intraday
+            cleaned_data["metadata"] = metadata
 
-        # Clean Time Series data (find the time series key)
-        time_series_key = None
-        for key in raw_data.keys():
-            if "Time Series" in key:
-                time_series_key = key
-                break
-
-        if time_series_key and time_series_key in raw_data:
-            time_series = raw_data[time_series_key]
-            cleaned_time_series = {}
-
-            for date, data in time_series.items():
-                cleaned_time_series[date] = {
-                    "open": data.get("1. open"),
-                    "high": data.get("2. high"),
-                    "low": data.get("3. low"),
-                    "close": data.get("4. close"),
-                    "adjusted_close": data.get(
-                        "5. adjusted close"
-                    ),  # For adjusted data
-                    "volume": data.get("5. volume") or data.get("6. volume"),
-                    "dividend_amount": data.get("7. dividend amount"),
-                    "split_coefficient": data.get("8. split coefficient"),
-                }
-                # Remove None values
-                cleaned_time_series[date] = {
-                    k: v for k, v in cleaned_time_series[date].items() if v is not None
-                }
-
-            # Convert object to sorted array with date field
-            items_array = []
-            for date, values in sorted(cleaned_time_series.items()):
-                item = {"date": date}
-                item.update(values)
-                items_array.append(item)
-            cleaned_data["items"] = items_array
+        # Clean Time Series data
+        time_series_key = _time_series_key(
+            raw_data, _STOCK_SERIES_KEYS.get((interval, bool(adjusted)))
+        )
+        if time_series_key:
+            cleaned_data["items"] = _series_items(
+                raw_data[time_series_key], _STOCK_VALUE_KEYS
+            )
 
         return cleaned_data
 
@@ -1732,22 +1897,9 @@ async def lookup_stock_symbol(keywords: str) -> Dict[str, Any]:
 
     # Clean up the keys
     if isinstance(raw_data, dict) and "bestMatches" in raw_data:
-        cleaned_matches = []
-        for match in raw_data["bestMatches"]:
-            cleaned_match = {
-                "symbol": match.get("1. symbol"),
-                "name": match.get("2. name"),
-                "type": match.get("3. type"),
-                "region": match.get("4. region"),
-                "market_open": match.get("5. marketOpen"),
-                "market_close": match.get("6. marketClose"),
-                "timezone": match.get("7. timezone"),
-                "currency": match.get("8. currency"),
-                "match_score": match.get("9. matchScore"),
-            }
-            # Remove None values
-            cleaned_match = {k: v for k, v in cleaned_match.items() if v is not None}
-            cleaned_matches.append(cleaned_match)
+        cleaned_matches = [
+            _remap_keys(match, _SYMBOL_MATCH_KEYS) for match in raw_data["bestMatches"]
+        ]
 
         return {
             "keywords": keywords,
@@ -1776,42 +1928,45 @@ async def get_top_gainers_losers() -> Dict[str, Any]:
 
 
 # Update the TOOL_FUNCTIONS mapping with new unified functions
-TOOL_FUNCTIONS = {
-    # Core Market Data (unified functions)
-    "get_current_stock_quote": get_current_stock_quote,
-    "get_stock_time_series": get_stock_time_series,
-    "lookup_stock_symbol": lookup_stock_symbol,
-    "get_global_markets_status": fetch_market_status,
-    # Options
-    "get_historical_options": get_historical_options,
-    # Intelligence & Analytics
-    "get_top_gainers_losers": get_top_gainers_losers,
-    "get_news_sentiment": get_news_sentiment,
-    "get_stock_insider_transactions": fetch_insider_transactions,
-    "analyze_stocks": analyze_stocks,
-    # Fundamental Data
-    "get_symbol_overview": get_symbol_overview,
-    "get_financial_statements": get_financial_statements,
-    "get_earning_data": get_earning_data,
-    "get_corporate_actions": get_corporate_actions,
-    "get_market_calendar": get_market_calendar,
-    "get_listing_status": get_listing_status,
-    # Forex
-    "get_current_fx_rate": get_current_fx_rate,
-    "get_fx_time_series": get_fx_time_series,
-    # Crypto
-    "get_current_crypto_quote": get_current_crypto_quote,
-    "get_crypto_time_series": get_crypto_time_series,
-    # Commodities
-    "get_commodities": get_commodities,
-    # Economic Indicators
-    "get_growth_metrics": get_growth_metrics,
-    "get_rates_yields": get_rates_yields,
-    "get_prices_inflation": get_prices_inflation,
-    "get_labor_activity": get_labor_activity,
-    # Technical Indicators (unified function)
-    "get_trend_indicators": get_trend_indicators,
-    "get_momentum_indicators": get_momentum_indicators,
-    "get_volatility_indicators": get_volatility_indicators,
-    "get_volume_indicators": get_volume_indicators,
-}
+TOOL_FUNCTIONS = MappingProxyType(
+    {
+        # Core Market Data (unified functions)
+        "get_current_stock_quote": get_current_stock_quote,
+        "get_bulk_quotes": get_bulk_quotes,
+        "get_stock_time_series": get_stock_time_series,
+        "lookup_stock_symbol": lookup_stock_symbol,
+        "get_global_markets_status": fetch_market_status,
+        # Options
+        "get_historical_options": get_historical_options,
+        # Intelligence & Analytics
+        "get_top_gainers_losers": get_top_gainers_losers,
+        "get_news_sentiment": get_news_sentiment,
+        "get_stock_insider_transactions": fetch_insider_transactions,
+        "analyze_stocks": analyze_stocks,
+        # Fundamental Data
+        "get_symbol_overview": get_symbol_overview,
+        "get_financial_statements": get_financial_statements,
+        "get_earning_data": get_earning_data,
+        "get_corporate_actions": get_corporate_actions,
+        "get_market_calendar": get_market_calendar,
+        "get_listing_status": get_listing_status,
+        # Forex
+        "get_current_fx_rate": get_current_fx_rate,
+        "get_fx_time_series": get_fx_time_series,
+        # Crypto
+        "get_current_crypto_quote": get_current_crypto_quote,
+        "get_crypto_time_series": get_crypto_time_series,
+        # Commodities
+        "get_commodities": get_commodities,
+        # Economic Indicators
+        "get_growth_metrics": get_growth_metrics,
+        "get_rates_yields": get_rates_yields,
+        "get_prices_inflation": get_prices_inflation,
+        "get_labor_activity": get_labor_activity,
+        # Technical Indicators (unified function)
+        "get_trend_indicators": get_trend_indicators,
+        "get_momentum_indicators": get_momentum_indicators,
+        "get_volatility_indicators": get_volatility_indicators,
+        "get_volume_indicators": get_volume_indicators,
+    }
+)
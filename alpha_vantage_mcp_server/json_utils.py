@@ -0,0 +1,30 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes, stringifying unknown types."""
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option)
+
+    json_loads = orjson.loads
+
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes, stringifying unknown types."""
+        return json.dumps(
+            obj,
+            default=str,
+            sort_keys=sort_keys,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode()
+
+    json_loads = json.loads
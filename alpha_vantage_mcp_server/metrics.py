@@ -0,0 +1,42 @@
+"""Prometheus metrics for tool calls and the response cache.
+
+Metrics are recorded only when the optional ``prometheus_client`` package is
+installed; otherwise every function here is a no-op.
+"""
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+if prometheus_client is not None:
+    TOOL_LATENCY = prometheus_client.Histogram(
+        "av_tool_seconds",
+        "Time spent handling a tool call",
+        ["tool", "outcome"],
+    )
+    CACHE_LOOKUPS = prometheus_client.Counter(
+        "av_cache_lookups_total",
+        "Response cache lookups",
+        ["name", "result"],
+    )
+
+
+def observe_tool_call(tool: str, outcome: str, seconds: float) -> None:
+    """Record the duration and outcome (``ok`` or ``error``) of a tool call."""
+    if prometheus_client is not None:
+        TOOL_LATENCY.labels(tool, outcome).observe(seconds)
+
+
+def record_cache_lookup(name: str, hit: bool) -> None:
+    """Record a response cache hit or miss for ``name``."""
+    if prometheus_client is not None:
+        CACHE_LOOKUPS.labels(name, "hit" if hit else "miss").inc()
+
+
+def start_metrics_server(port: int) -> bool:
+    """Serve metrics over HTTP on ``port``; return False if unavailable."""
+    if prometheus_client is None:
+        return False
+    prometheus_client.start_http_server(port)
+    return True
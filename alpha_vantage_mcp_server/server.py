@@ -1,16 +1,23 @@
+import asyncio
+import functools
 import json
 import logging
 import os
+import sys
 from typing import Any
 
+import jsonschema
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
+from alpha_vantage_mcp_server.api_helpers import aclose_client, warm_up_connections
+from alpha_vantage_mcp_server.dispatch import dispatch, is_known_tool, warm_cache
 from alpha_vantage_mcp_server.handlers import (
     TOOL_FUNCTIONS,
 )
+from alpha_vantage_mcp_server.metrics import start_metrics_server
 
 
 logging.basicConfig(
@@ -36,7 +43,7 @@ def load_tool_schemas() -> dict[str, Any]:
         try:
             with open(path, "r") as f:
                 schema_data = json.load(f)
-            return {tool["name"]: tool for tool in schema_data["tools"]}
+            return {sys.intern(tool["name"]): tool for tool in schema_data["tools"]}
         except FileNotFoundError:
             continue
         except json.JSONDecodeError as e:
@@ -50,6 +57,15 @@ TOOL_SCHEMAS = load_tool_schemas()
 server = Server("AlphaVantageAPI")
 
 
+@functools.lru_cache(maxsize=None)
+def _input_validator(name: str) -> Any:
+    """Build the input schema validator for a tool once and reuse it."""
+    schema = TOOL_SCHEMAS[name]["inputSchema"]
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     tools: list[types.Tool] = []
@@ -65,34 +81,66 @@ async def handle_list_tools() -> list[types.Tool]:
     return tools
 
 
-@server.call_tool()
+# Inputs are validated below with cached validators instead of by the SDK,
+# which rebuilds the validator for every call
+@server.call_tool(validate_input=False)
 async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> Any:
-    if name not in TOOL_FUNCTIONS:
+    # Interned once here, so the lookups below compare by identity
+    name = sys.intern(name)
+    if not is_known_tool(name):
         raise ValueError(f"Unknown tool: {name}")
 
-    if arguments is None:
-        arguments = {}
+    if name in TOOL_SCHEMAS:
+        error = jsonschema.exceptions.best_match(
+            _input_validator(name).iter_errors(arguments or {})
+        )
+        if error is not None:
+            raise ValueError(f"Input validation error: {error.message}")
 
     try:
-        tool_function = TOOL_FUNCTIONS[name]
-        result = await tool_function(**arguments)
-        return result
+        return await dispatch(name, arguments)
     except Exception as e:
         logger.error(f"Error calling tool {name}: {e}")
         raise ValueError(f"Tool execution error: {str(e)}")
 
 
 async def run_server() -> None:
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="AlphaVantageAPI",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    metrics_port = os.getenv("METRICS_PORT")
+    if metrics_port:
+        try:
+            if not start_metrics_server(int(metrics_port)):
+                logger.warning(
+                    "METRICS_PORT is set but prometheus_client is not installed"
+                )
+        except (ValueError, OverflowError, OSError) as e:
+            # A bad port only disables metrics, it does not stop the server
+            logger.warning(f"Not serving metrics on METRICS_PORT={metrics_port}: {e}")
+
+    # Comma-separated symbols whose lookups and overviews are cached at startup
+    warmup_symbols = [
+        symbol.strip().upper()
+        for symbol in os.getenv("WARMUP_SYMBOLS", "").split(",")
+        if symbol.strip()
+    ]
+    background = [asyncio.create_task(warm_up_connections())]
+    if warmup_symbols:
+        background.append(asyncio.create_task(warm_cache(warmup_symbols)))
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="AlphaVantageAPI",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        for task in background:
+            task.cancel()
+        # Close pooled connections to Alpha Vantage on shutdown
+        await aclose_client()
@@ -359,6 +359,136 @@ async def test_server_components():
         return False, {}
 
 
+async def test_dispatch_notices_not_cached() -> bool:
+    """Check that throttled responses fail through dispatch and are not cached."""
+    print("\n🧪 Testing rate-limit notices through dispatch")
+    print("-" * 50)
+
+    from alpha_vantage_mcp_server import api_helpers
+    from alpha_vantage_mcp_server.dispatch import dispatch
+
+    class FakeResponse:
+        def __init__(self, body: Dict[str, Any]):
+            self.content = json.dumps(body).encode()
+            self.text = self.content.decode()
+
+    notice = FakeResponse({"Information": "API rate limit reached"})
+    data = FakeResponse({"symbol": "NOTICE", "annualReports": []})
+    upstream_calls = 0
+    throttled_functions = None
+
+    async def fake_get(https_params):
+        nonlocal upstream_calls
+        upstream_calls += 1
+        if throttled_functions and https_params["function"] not in throttled_functions:
+            return data
+        return notice
+
+    # (tool, arguments, API functions answered with a notice; None for all)
+    cases = [
+        ("get_corporate_actions", {"symbol": "NOTICE"}, None),
+        ("get_earning_data", {"symbol": "NOTICE"}, None),
+        ("get_growth_metrics", {}, None),
+        ("get_rates_yields", {}, None),
+        (
+            "get_financial_statements",
+            {"symbol": "NOTICE", "statement_type": "all"},
+            {"CASH_FLOW"},
+        ),
+        # CSV endpoints answer with a JSON notice as well
+        ("get_listing_status", {"state": "delisted"}, None),
+        ("get_market_calendar", {"symbol": "NOTICE"}, None),
+        # Indicator packs fail outright when no indicator could be fetched
+        ("get_trend_indicators", {"symbol": "NOTICE", "interval": "daily"}, None),
+    ]
+
+    real_get = api_helpers._get
+    api_helpers._get = fake_get
+    ok = True
+    try:
+        for tool_name, arguments, throttled_functions in cases:
+            upstream_calls = 0
+            errors = 0
+            for _ in range(2):
+                try:
+                    await dispatch(tool_name, arguments)
+                except Exception:
+                    errors += 1
+            # Both calls must fail and both must reach the (fake) upstream
+            passed = errors == 2 and upstream_calls >= 2
+            ok = ok and passed
+            status_icon = "✅" if passed else "❌"
+            print(
+                f"    {status_icon} {tool_name}: {errors}/2 calls failed, "
+                f"{upstream_calls} upstream requests"
+            )
+
+        # Concurrent identical calls must share one execution, even a failing one
+        # (tool, arguments, upstream requests made by one execution)
+        concurrent_cases = [
+            ("get_trend_indicators", {"symbol": "SHARED", "interval": "daily"}, 4),
+            ("get_financial_statements", {"symbol": "SHARED"}, 3),
+            ("get_symbol_overview", {"symbol": "SHARED", "profile_type": "company"}, 1),
+        ]
+        throttled_functions = None
+        for tool_name, arguments, expected_calls in concurrent_cases:
+            upstream_calls = 0
+            results = await asyncio.gather(
+                *(dispatch(tool_name, arguments) for _ in range(5)),
+                return_exceptions=True,
+            )
+            errors = sum(isinstance(result, Exception) for result in results)
+            passed = errors == 5 and upstream_calls == expected_calls
+            ok = ok and passed
+            status_icon = "✅" if passed else "❌"
+            print(
+                f"    {status_icon} {tool_name} x5 concurrently: {errors}/5 calls "
+                f"failed, {upstream_calls} upstream requests"
+            )
+    finally:
+        api_helpers._get = real_get
+    return ok
+
+
+async def test_cached_call_coalescing() -> bool:
+    """Check that cached_call never runs the same key twice at once."""
+    print("\n🧪 Testing concurrent cache misses")
+    print("-" * 50)
+
+    from alpha_vantage_mcp_server import cache
+
+    running = peak = executions = 0
+
+    async def failing_fetch():
+        nonlocal running, peak, executions
+        executions += 1
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream failed")
+        finally:
+            running -= 1
+
+    async def caller(delay: float):
+        # Staggered, so callers also arrive just as the lock is released
+        await asyncio.sleep(delay)
+        try:
+            await cache.cached_call("coalescing_check", 60, failing_fetch)
+        except ValueError:
+            pass
+
+    await asyncio.gather(*(caller(i * 0.005) for i in range(10)))
+    # Failures are not cached, so every caller runs the fetch, one at a time
+    passed = peak == 1 and executions == 10 and not cache._LOCKS
+    status_icon = "✅" if passed else "❌"
+    print(
+        f"    {status_icon} {executions} executions, at most {peak} at once, "
+        f"{len(cache._LOCKS)} locks left"
+    )
+    return passed
+
+
 async def run_tool_tests(schemas: Dict[str, Any]):
     """Run all tool tests with real API calls and comprehensive schema validation."""
     print("\n🧪 Running Tool Tests with Schema Validation")
@@ -434,6 +564,12 @@ async def main():
         print("\n❌ Component tests failed - skipping tool tests")
         return
 
+    if not await test_dispatch_notices_not_cached():
+        print("\n❌ Rate-limit notices were cached or returned as data")
+
+    if not await test_cached_call_coalescing():
+        print("\n❌ Concurrent cache misses ran the same call at once")
+
     # Run tool tests with schema validation
     results = await run_tool_tests(schemas)
 